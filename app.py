@@ -1,14 +1,16 @@
 import streamlit as st
+import hashlib
+import io
 import json
 import os
-from modules.translation import TranslationService
+from modules.translation import TranslationService, PREFETCH_POOL
 from modules.text_to_speech import TTSService
 from modules.image_recognition import ImageRecognitionService
 from modules.recipe_generator import RecipeGenerator
 from modules.data_handler import DataHandler
 from modules.accessibility import AccessibilityHelper
 from utils.config import Config
-from utils.constants import LANGUAGES, MENU_ITEMS
+from utils.constants import LANGUAGES, MENU_ITEMS, APP_TEXT, UI_CONFIG, t
 
 # Page configuration
 st.set_page_config(
@@ -18,6 +20,18 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Localized strings for the page title and feature menu
+LOCALIZED_TEXT = {
+    'app_title': APP_TEXT['app_title'],
+    'menu_recipes': MENU_ITEMS['recipes'],
+    'menu_ingredients': MENU_ITEMS['ingredients'],
+    'menu_generate': MENU_ITEMS['generate'],
+    'menu_newspapers': MENU_ITEMS['newspapers']
+}
+
+# Language selector labels, shown in each language's own script
+LANGUAGE_OPTIONS = {key: language['native_name'] for key, language in LANGUAGES.items()}
+
 # Initialize services
 @st.cache_resource
 def init_services():
@@ -39,6 +53,36 @@ def init_services():
         'accessibility': accessibility_helper
     }
 
+@st.cache_data(ttl=3600, max_entries=10_000, show_spinner=False)
+def cached_translate_batch(_translation_service, texts, target_lang):
+    """Translate a tuple of texts, reusing results across reruns and sessions"""
+    return _translation_service.translate_batch(list(texts), target_lang)
+
+def cached_translate(translation_service, text, target_lang):
+    """Translate a single text through the shared translation cache"""
+    return cached_translate_batch(translation_service, (text,), target_lang)[0]
+
+@st.cache_data(ttl=86400, max_entries=500, show_spinner=False)
+def cached_audio(_tts_service, text, language):
+    """Synthesize speech for text, reusing audio bytes across reruns and sessions"""
+    if not text or not text.strip():
+        return None
+    return _tts_service.synthesize_long(text, language)
+
+def prefetch_translation(translation_service, texts, target_lang):
+    """Warm the translation cache in the background for a likely next view"""
+    key = (hash(texts), target_lang)
+    if key not in st.session_state.prefetched_translations:
+        st.session_state.prefetched_translations.add(key)
+        PREFETCH_POOL.submit(cached_translate_batch, translation_service, texts, target_lang)
+
+def translate_or_keep(translation_service, text, target_lang):
+    """Translate a single text, keeping the original if translation fails"""
+    try:
+        return cached_translate(translation_service, text, target_lang)
+    except Exception:
+        return text
+
 def initialize_session_state():
     """Initialize session state variables"""
     if 'language' not in st.session_state:
@@ -47,59 +91,38 @@ def initialize_session_state():
         st.session_state.current_recipe = None
     if 'search_results' not in st.session_state:
         st.session_state.search_results = []
+    if 'news_page' not in st.session_state:
+        st.session_state.news_page = 0
+    if 'prefetched_translations' not in st.session_state:
+        st.session_state.prefetched_translations = set()
+    if 'image_hash' not in st.session_state:
+        st.session_state.image_hash = None
+    if 'identified_ingredients' not in st.session_state:
+        st.session_state.identified_ingredients = []
 
 def render_language_toggle():
     """Render language toggle in sidebar"""
     st.sidebar.markdown("---")
     st.sidebar.subheader("🌐 Language / భాష")
     
-    language_options = {
-        'english': 'English',
-        'telugu': 'తెలుగు'
-    }
-    
-    selected_language = st.sidebar.selectbox(
+    # Bound to st.session_state.language, which Streamlit updates on change
+    st.sidebar.selectbox(
         "Select Language",
-        options=list(language_options.keys()),
-        format_func=lambda x: language_options[x],
-        index=0 if st.session_state.language == 'english' else 1,
-        key="language_selector"
+        options=list(LANGUAGE_OPTIONS.keys()),
+        format_func=LANGUAGE_OPTIONS.get,
+        key="language"
     )
-    
-    if selected_language != st.session_state.language:
-        st.session_state.language = selected_language
-        st.rerun()
 
-def get_localized_text(text_key, services):
+def get_localized_text(text_key):
     """Get localized text based on current language"""
-    translations = {
-        'app_title': {
-            'english': 'Sahachari: Bilingual Food & Culture Companion',
-            'telugu': 'సహచారి: ద్విభాషా ఆహార మరియు సంస్కృతి సహచరుడు'
-        },
-        'menu_recipes': {
-            'english': '📖 Translate & Listen to Recipes',
-            'telugu': '📖 వంటకాలను అనువదించండి మరియు వినండి'
-        },
-        'menu_ingredients': {
-            'english': '📷 Recognize Ingredients from Image',
-            'telugu': '📷 చిత్రం నుండి పదార్థాలను గుర్తించండి'
-        },
-        'menu_generate': {
-            'english': '🍳 Generate Dishes',
-            'telugu': '🍳 వంటకాలను రూపొందించండి'
-        },
-        'menu_newspapers': {
-            'english': '📰 Explore Historic Newspapers',
-            'telugu': '📰 చారిత్రక వార్తాపత్రికలను అన్వేషించండి'
-        }
-    }
-    
-    return translations.get(text_key, {}).get(st.session_state.language, text_key)
+    return LOCALIZED_TEXT.get(text_key, {}).get(st.session_state.language, text_key)
 
+@st.fragment
 def render_recipe_module(services):
     """Render recipe translation and TTS module"""
-    st.header(get_localized_text('menu_recipes', services))
+    lang = st.session_state.language
+    
+    st.header(get_localized_text('menu_recipes'))
     
     # Get recipes from data handler
     recipes = services['data_handler'].get_recipes()
@@ -109,10 +132,20 @@ def render_recipe_module(services):
         return
     
     # Recipe selection
-    recipe_names = [recipe.get('name', f"Recipe {i+1}") for i, recipe in enumerate(recipes)]
+    recipe_names = services['data_handler'].get_recipe_names()
+    recipe_indices = range(len(recipe_names))
+    
+    # Large collections are narrowed with a filter instead of one huge list
+    max_options = UI_CONFIG['max_recipe_options']
+    if len(recipe_names) > max_options:
+        name_filter = st.text_input(t('recipe', 'filter_recipes', lang)).strip().lower()
+        if name_filter:
+            recipe_indices = [i for i in recipe_indices if name_filter in recipe_names[i].lower()]
+        recipe_indices = recipe_indices[:max_options]
+    
     selected_recipe_idx = st.selectbox(
-        "Select a recipe:" if st.session_state.language == 'english' else "వంటకం ఎంచుకోండి:",
-        range(len(recipe_names)),
+        t('recipe', 'select_recipe', lang),
+        recipe_indices,
         format_func=lambda x: recipe_names[x]
     )
     
@@ -124,165 +157,180 @@ def render_recipe_module(services):
         col1, col2 = st.columns(2)
         
         with col1:
-            st.subheader("Original" if st.session_state.language == 'english' else "మూలం")
+            st.subheader(t('recipe', 'original', lang))
             st.write(f"**Name:** {recipe.get('name', 'N/A')}")
             st.write(f"**Ingredients:** {recipe.get('ingredients', 'N/A')}")
             st.write(f"**Instructions:** {recipe.get('instructions', 'N/A')}")
             
             # TTS for original
-            if st.button("🔊 Listen (Original)" if st.session_state.language == 'english' else "🔊 వినండి (మూలం)"):
+            if st.button(t('recipe', 'listen_original', lang)):
                 try:
-                    audio_file = services['tts'].generate_audio(
+                    audio_bytes = cached_audio(
+                        services['tts'],
                         recipe.get('instructions', ''), 
                         'en' if recipe.get('language', 'english') == 'english' else 'te'
                     )
-                    if audio_file:
-                        st.audio(audio_file)
+                    if audio_bytes:
+                        st.audio(audio_bytes, format='audio/mp3')
                 except Exception as e:
                     st.error(f"Audio generation failed: {str(e)}")
         
         with col2:
-            st.subheader("Translation" if st.session_state.language == 'english' else "అనువాదం")
+            st.subheader(t('recipe', 'translation', lang))
             
-            target_lang = 'te' if st.session_state.language == 'english' else 'en'
+            target_lang = 'te' if lang == 'english' else 'en'
+            recipe_texts = (recipe.get('name', ''), recipe.get('ingredients', ''), recipe.get('instructions', ''))
             
             try:
-                translated_name = services['translation'].translate_text(recipe.get('name', ''), target_lang)
-                translated_ingredients = services['translation'].translate_text(recipe.get('ingredients', ''), target_lang)
-                translated_instructions = services['translation'].translate_text(recipe.get('instructions', ''), target_lang)
+                translated_name, translated_ingredients, translated_instructions = cached_translate_batch(
+                    services['translation'], recipe_texts, target_lang
+                )
                 
                 st.write(f"**Name:** {translated_name}")
                 st.write(f"**Ingredients:** {translated_ingredients}")
                 st.write(f"**Instructions:** {translated_instructions}")
                 
                 # TTS for translation
-                if st.button("🔊 Listen (Translation)" if st.session_state.language == 'english' else "🔊 వినండి (అనువాదం)"):
+                if st.button(t('recipe', 'listen_translation', lang)):
                     try:
-                        audio_file = services['tts'].generate_audio(translated_instructions, target_lang)
-                        if audio_file:
-                            st.audio(audio_file)
+                        audio_bytes = cached_audio(services['tts'], translated_instructions, target_lang)
+                        if audio_bytes:
+                            st.audio(audio_bytes, format='audio/mp3')
                     except Exception as e:
                         st.error(f"Audio generation failed: {str(e)}")
                         
             except Exception as e:
                 st.error(f"Translation failed: {str(e)}")
+            
+            # Switching the UI language flips the translation direction
+            prefetch_translation(services['translation'], recipe_texts, 'en' if target_lang == 'te' else 'te')
 
+@st.fragment
 def render_ingredient_recognition(services):
     """Render ingredient recognition module"""
-    st.header(get_localized_text('menu_ingredients', services))
+    lang = st.session_state.language
+    
+    st.header(get_localized_text('menu_ingredients'))
     
     uploaded_file = st.file_uploader(
-        "Upload a food image:" if st.session_state.language == 'english' else "ఆహార చిత్రాన్ని అప్‌లోడ్ చేయండి:",
+        t('ingredient', 'upload_image', lang),
         type=['jpg', 'png', 'jpeg'],
         help="Upload an image to identify ingredients"
     )
     
     if uploaded_file is not None:
+        # Read the upload once and key the analysis on its content
+        image_bytes = uploaded_file.getvalue()
+        image_hash = hashlib.sha1(image_bytes).hexdigest()
+        
         # Display uploaded image
-        st.image(uploaded_file, caption="Uploaded Image", use_column_width=True)
+        st.image(image_bytes, caption="Uploaded Image", use_column_width=True)
         
         # Process image
-        with st.spinner("Analyzing image..." if st.session_state.language == 'english' else "చిత్రాన్ని విశ్లేషిస్తోంది..."):
+        with st.spinner(t('ingredient', 'analyzing_image', lang)):
             try:
-                ingredients = services['image'].identify_ingredients(uploaded_file)
+                if st.session_state.image_hash == image_hash:
+                    # Same image as the previous run, reuse its analysis
+                    ingredients = st.session_state.identified_ingredients
+                else:
+                    ingredients = services['image'].identify_ingredients(io.BytesIO(image_bytes))
+                    
+                    # Failed or empty analyses are retried on the next run
+                    if ingredients:
+                        st.session_state.image_hash = image_hash
+                        st.session_state.identified_ingredients = ingredients
                 
                 if ingredients:
-                    st.success("Ingredients identified!" if st.session_state.language == 'english' else "పదార్థాలు గుర్తించబడ్డాయి!")
+                    st.success(t('ingredient', 'ingredients_identified', lang))
                     
                     # Display identified ingredients
-                    st.subheader("Identified Ingredients:" if st.session_state.language == 'english' else "గుర్తించిన పదార్థాలు:")
+                    st.subheader(t('ingredient', 'identified_ingredients', lang))
+                    
+                    names = [ingredient.get('name', 'Unknown') for ingredient in ingredients]
                     
-                    for ingredient in ingredients:
+                    # Translate ingredient names if needed
+                    if lang == 'telugu':
+                        try:
+                            names = cached_translate_batch(services['translation'], tuple(names), 'te')
+                        except Exception:
+                            names = [translate_or_keep(services['translation'], name, 'te') for name in names]
+                    
+                    for ingredient, name in zip(ingredients, names):
                         confidence = ingredient.get('confidence', 0)
-                        name = ingredient.get('name', 'Unknown')
-                        
-                        # Translate ingredient name if needed
-                        if st.session_state.language == 'telugu':
-                            try:
-                                name = services['translation'].translate_text(name, 'te')
-                            except:
-                                pass  # Keep original if translation fails
-                        
                         st.write(f"• {name} (Confidence: {confidence:.2f})")
                     
                     # Suggest recipes based on ingredients
-                    if st.button("Suggest Recipes" if st.session_state.language == 'english' else "వంటకాలను సూచించండి"):
+                    if st.button(t('ingredient', 'suggest_recipes', lang)):
                         ingredient_names = [ing.get('name', '') for ing in ingredients]
                         suggested_recipes = services['recipe_generator'].suggest_recipes(ingredient_names)
                         
                         if suggested_recipes:
-                            st.subheader("Suggested Recipes:" if st.session_state.language == 'english' else "సూచించిన వంటకాలు:")
+                            st.subheader(t('ingredient', 'suggested_recipes', lang))
                             for recipe in suggested_recipes:
                                 st.write(f"• {recipe}")
                         else:
-                            st.info("No recipes found for these ingredients." if st.session_state.language == 'english' else "ఈ పదార్థాలకు వంటకాలు కనుగొనబడలేదు.")
+                            st.info(t('ingredient', 'no_recipes_for_ingredients', lang))
                 else:
-                    st.warning("No ingredients could be identified in the image." if st.session_state.language == 'english' else "చిత్రంలో పదార్థాలు గుర్తించబడలేదు.")
+                    st.warning(t('ingredient', 'no_ingredients_found', lang))
                     
             except Exception as e:
                 st.error(f"Image analysis failed: {str(e)}")
 
+@st.fragment
 def render_recipe_generator(services):
     """Render recipe generation module"""
-    st.header(get_localized_text('menu_generate', services))
+    lang = st.session_state.language
+    
+    st.header(get_localized_text('menu_generate'))
     
     # Input method selection
     input_method = st.radio(
-        "Choose input method:" if st.session_state.language == 'english' else "ఇన్‌పుట్ పద్ధతిని ఎంచుకోండి:",
-        ["Ingredients List", "Recipe Type"],
-        format_func=lambda x: x if st.session_state.language == 'english' else 
-                    ("పదార్థాల జాబితా" if x == "Ingredients List" else "వంటకం రకం")
+        t('generation', 'input_method', lang),
+        ['ingredients_list', 'recipe_type'],
+        format_func=lambda x: t('generation', x, lang)
     )
     
-    if input_method == "Ingredients List":
+    if input_method == 'ingredients_list':
         ingredients_input = st.text_area(
-            "Enter available ingredients (comma-separated):" if st.session_state.language == 'english' else 
-            "అందుబాటులో ఉన్న పదార్థాలను నమోదు చేయండి (కామాతో వేరు చేయబడిన):",
-            placeholder="tomato, onion, rice, chicken..." if st.session_state.language == 'english' else 
-                       "టమాటా, ఉల్లిపాయ, అన్నం, చికెన్..."
+            t('generation', 'enter_ingredients', lang),
+            placeholder=t('generation', 'ingredients_placeholder', lang)
         )
         
-        if ingredients_input and st.button("Generate Recipes" if st.session_state.language == 'english' else "వంటకాలను రూపొందించండి"):
+        if ingredients_input and st.button(t('generation', 'generate_recipes', lang)):
             ingredients = [ing.strip() for ing in ingredients_input.split(',')]
             
-            with st.spinner("Generating recipes..." if st.session_state.language == 'english' else "వంటకాలను రూపొందిస్తోంది..."):
+            with st.spinner(t('generation', 'generating_recipes', lang)):
                 try:
                     recipes = services['recipe_generator'].generate_from_ingredients(ingredients)
                     
                     if recipes:
-                        st.success(f"Generated {len(recipes)} recipes!" if st.session_state.language == 'english' else f"{len(recipes)} వంటకాలు రూపొందించబడ్డాయి!")
+                        st.success(t('success', 'recipes_generated', lang).format(count=len(recipes)))
                         
                         for i, recipe in enumerate(recipes, 1):
-                            with st.expander(f"Recipe {i}: {recipe.get('name', 'Unnamed')}" if st.session_state.language == 'english' else f"వంటకం {i}: {recipe.get('name', 'పేరులేని')}"):
+                            with st.expander(t('generation', 'recipe_title', lang).format(index=i, name=recipe.get('name', t('generation', 'unnamed', lang)))):
                                 st.write(f"**Ingredients:** {recipe.get('ingredients', 'N/A')}")
                                 st.write(f"**Instructions:** {recipe.get('instructions', 'N/A')}")
                                 st.write(f"**Cooking Time:** {recipe.get('cooking_time', 'N/A')}")
                     else:
-                        st.info("No recipes could be generated with the provided ingredients." if st.session_state.language == 'english' else "అందించిన పదార్థాలతో వంటకాలు రూపొందించబడలేదు.")
+                        st.info(t('generation', 'no_recipe_generated', lang))
                         
                 except Exception as e:
                     st.error(f"Recipe generation failed: {str(e)}")
     
     else:  # Recipe Type
         recipe_type = st.selectbox(
-            "Select recipe type:" if st.session_state.language == 'english' else "వంటకం రకాన్ని ఎంచుకోండి:",
+            t('generation', 'select_recipe_type', lang),
             ["Traditional", "Modern", "Fusion", "Healthy", "Quick"],
-            format_func=lambda x: {
-                "Traditional": "సాంప్రదాయ" if st.session_state.language == 'telugu' else "Traditional",
-                "Modern": "ఆధునిక" if st.session_state.language == 'telugu' else "Modern",
-                "Fusion": "మిశ్రమ" if st.session_state.language == 'telugu' else "Fusion",
-                "Healthy": "ఆరోగ్యకరమైన" if st.session_state.language == 'telugu' else "Healthy",
-                "Quick": "త్వరిత" if st.session_state.language == 'telugu' else "Quick"
-            }.get(x, x)
+            format_func=lambda x: t('recipe_type', x.lower(), lang)
         )
         
-        if st.button("Generate Recipe" if st.session_state.language == 'english' else "వంటకం రూపొందించండి"):
-            with st.spinner("Generating recipe..." if st.session_state.language == 'english' else "వంటకం రూపొందిస్తోంది..."):
+        if st.button(t('generation', 'generate_recipe', lang)):
+            with st.spinner(t('generation', 'generating_recipe', lang)):
                 try:
                     recipe = services['recipe_generator'].generate_by_type(recipe_type)
                     
                     if recipe:
-                        st.success("Recipe generated!" if st.session_state.language == 'english' else "వంటకం రూపొందించబడింది!")
+                        st.success(t('generation', 'recipe_generated', lang))
                         
                         st.subheader(recipe.get('name', 'Generated Recipe'))
                         st.write(f"**Type:** {recipe.get('type', 'N/A')}")
@@ -291,43 +339,54 @@ def render_recipe_generator(services):
                         st.write(f"**Cooking Time:** {recipe.get('cooking_time', 'N/A')}")
                         st.write(f"**Difficulty:** {recipe.get('difficulty', 'N/A')}")
                     else:
-                        st.info("Could not generate a recipe of this type." if st.session_state.language == 'english' else "ఈ రకమైన వంటకం రూపొందించబడలేదు.")
+                        st.info(t('generation', 'recipe_type_failed', lang))
                         
                 except Exception as e:
                     st.error(f"Recipe generation failed: {str(e)}")
 
+@st.fragment
 def render_historic_newspapers(services):
     """Render historic newspapers module"""
-    st.header(get_localized_text('menu_newspapers', services))
+    lang = st.session_state.language
+    
+    st.header(get_localized_text('menu_newspapers'))
     
     # Search functionality
     search_query = st.text_input(
-        "Search historic content:" if st.session_state.language == 'english' else "చారిత్రక కంటెంట్‌ను వెతకండి:",
-        placeholder="Enter keywords..." if st.session_state.language == 'english' else "కీలక పదాలను నమోదు చేయండి..."
+        t('newspaper', 'search_content', lang),
+        placeholder=t('newspaper', 'search_placeholder', lang)
     )
     
     col1, col2 = st.columns([3, 1])
     with col1:
-        if search_query and st.button("Search" if st.session_state.language == 'english' else "వెతకండి"):
-            with st.spinner("Searching..." if st.session_state.language == 'english' else "వెతుకుతోంది..."):
+        if search_query and st.button(t('newspaper', 'search', lang)):
+            with st.spinner(t('newspaper', 'searching', lang)):
                 try:
                     results = services['data_handler'].search_newspapers(search_query)
                     st.session_state.search_results = results
+                    st.session_state.news_page = 0
                 except Exception as e:
                     st.error(f"Search failed: {str(e)}")
     
     with col2:
-        if st.button("Show All" if st.session_state.language == 'english' else "అన్నీ చూపించు"):
+        if st.button(t('newspaper', 'show_all', lang)):
             try:
                 st.session_state.search_results = services['data_handler'].get_newspapers()
+                st.session_state.news_page = 0
             except Exception as e:
                 st.error(f"Failed to load newspapers: {str(e)}")
     
     # Display results
     if st.session_state.search_results:
-        st.subheader(f"Found {len(st.session_state.search_results)} articles" if st.session_state.language == 'english' else f"{len(st.session_state.search_results)} వ్యాసాలు కనుగొనబడ్డాయి")
+        results = st.session_state.search_results
+        st.subheader(t('newspaper', 'articles_found', lang).format(count=len(results)))
+        
+        # Only build widgets for the current page of results
+        page_size = UI_CONFIG['articles_per_page']
+        page_count = (len(results) + page_size - 1) // page_size
+        page = min(st.session_state.news_page, page_count - 1)
         
-        for article in st.session_state.search_results:
+        for article in results[page * page_size:(page + 1) * page_size]:
             with st.expander(f"{article.get('title', 'Untitled')} - {article.get('date', 'No date')}"):
                 st.write(f"**Source:** {article.get('source', 'Unknown')}")
                 st.write(f"**Date:** {article.get('date', 'Unknown')}")
@@ -335,63 +394,70 @@ def render_historic_newspapers(services):
                 
                 # Translation option
                 if st.button(f"Translate", key=f"translate_{article.get('id', 'unknown')}"):
-                    target_lang = 'te' if st.session_state.language == 'english' else 'en'
+                    target_lang = 'te' if lang == 'english' else 'en'
                     try:
-                        translated_content = services['translation'].translate_text(
-                            article.get('content', ''), target_lang
+                        translated_content = cached_translate(
+                            services['translation'], article.get('content', ''), target_lang
                         )
                         st.write(f"**Translation:** {translated_content}")
                     except Exception as e:
                         st.error(f"Translation failed: {str(e)}")
+        
+        if page_count > 1:
+            prev_col, info_col, next_col = st.columns([1, 2, 1])
+            with prev_col:
+                st.button(t('newspaper', 'previous_page', lang), on_click=change_news_page, args=(-1,),
+                          disabled=page == 0)
+            with info_col:
+                st.write(t('newspaper', 'page_info', lang).format(page=page + 1, total=page_count))
+            with next_col:
+                st.button(t('newspaper', 'next_page', lang), on_click=change_news_page, args=(1,),
+                          disabled=page >= page_count - 1)
     else:
-        st.info("No articles found. Try a different search term or load all articles." if st.session_state.language == 'english' else "వ్యాసాలు కనుగొనబడలేదు. వేరే వెతుకు పదం ప్రయత్నించండి లేదా అన్ని వ్యాసాలను లోడ్ చేయండి.")
+        st.info(t('newspaper', 'no_articles', lang))
+
+def change_news_page(step):
+    """Move the newspaper results view by the given number of pages"""
+    st.session_state.news_page = max(0, st.session_state.news_page + step)
 
 def main():
     """Main application function"""
     # Initialize session state
     initialize_session_state()
     
-    # Initialize services
-    services = init_services()
-    
     # Render language toggle
     render_language_toggle()
+    lang = st.session_state.language
     
     # Main title
-    st.title(get_localized_text('app_title', services))
+    st.title(get_localized_text('app_title'))
+    
+    # Initialize services after the first elements are on screen, so a cold
+    # start shows the page chrome while the services are being built
+    services = init_services()
     
     # Accessibility notice
-    services['accessibility'].render_accessibility_notice(st.session_state.language)
+    services['accessibility'].render_accessibility_notice(lang)
     
     # Menu selection
-    menu_options = [
-        get_localized_text('menu_recipes', services),
-        get_localized_text('menu_ingredients', services),
-        get_localized_text('menu_generate', services),
-        get_localized_text('menu_newspapers', services)
-    ]
+    modules = {
+        LOCALIZED_TEXT['menu_recipes'][lang]: render_recipe_module,
+        LOCALIZED_TEXT['menu_ingredients'][lang]: render_ingredient_recognition,
+        LOCALIZED_TEXT['menu_generate'][lang]: render_recipe_generator,
+        LOCALIZED_TEXT['menu_newspapers'][lang]: render_historic_newspapers
+    }
     
     selected_menu = st.sidebar.selectbox(
-        "Choose Feature:" if st.session_state.language == 'english' else "ఫీచర్ ఎంచుకోండి:",
-        menu_options
+        t('app', 'choose_feature', lang),
+        list(modules)
     )
     
     # Render selected module
-    if selected_menu == get_localized_text('menu_recipes', services):
-        render_recipe_module(services)
-    elif selected_menu == get_localized_text('menu_ingredients', services):
-        render_ingredient_recognition(services)
-    elif selected_menu == get_localized_text('menu_generate', services):
-        render_recipe_generator(services)
-    elif selected_menu == get_localized_text('menu_newspapers', services):
-        render_historic_newspapers(services)
+    modules[selected_menu](services)
     
     # Footer
     st.sidebar.markdown("---")
-    st.sidebar.markdown(
-        "🍽️ **Sahachari** - Bridging Food & Culture" if st.session_state.language == 'english' else 
-        "🍽️ **సహచారి** - ఆహారం మరియు సంస్కృతిని కలుపుతోంది"
-    )
+    st.sidebar.markdown(t('app', 'footer_text', lang))
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,84 @@
 import streamlit as st
+from types import MappingProxyType
+
+# Style blocks injected by the accessibility modes
+HIGH_CONTRAST_CSS = """
+<style>
+.stApp {
+    background-color: #000000;
+    color: #FFFFFF;
+}
+.stButton > button {
+    background-color: #FFFFFF;
+    color: #000000;
+    border: 2px solid #FFFFFF;
+}
+.stSelectbox > div > div {
+    background-color: #000000;
+    color: #FFFFFF;
+}
+.stTextInput > div > div > input {
+    background-color: #000000;
+    color: #FFFFFF;
+    border: 2px solid #FFFFFF;
+}
+</style>
+"""
+
+LARGE_TEXT_CSS = """
+<style>
+.stApp {
+    font-size: 18px;
+}
+h1 {
+    font-size: 3rem !important;
+}
+h2 {
+    font-size: 2.5rem !important;
+}
+h3 {
+    font-size: 2rem !important;
+}
+.stButton > button {
+    font-size: 18px;
+    padding: 12px 24px;
+}
+</style>
+"""
+
+SCREEN_READER_CSS = """
+<style>
+.stApp {
+    --sr-only: {
+        position: absolute;
+        width: 1px;
+        height: 1px;
+        padding: 0;
+        margin: -1px;
+        overflow: hidden;
+        clip: rect(0, 0, 0, 0);
+        white-space: nowrap;
+        border: 0;
+    }
+}
+</style>
+"""
+
+# Read-only keyboard shortcut descriptions, shared by every helper instance
+KEYBOARD_SHORTCUTS = {
+    'english': MappingProxyType({
+        'Tab': 'Navigate between elements',
+        'Enter/Space': 'Activate buttons and links',
+        'Arrow Keys': 'Navigate within components',
+        'Esc': 'Close dialogs and popups'
+    }),
+    'telugu': MappingProxyType({
+        'Tab': 'ఎలిమెంట్స్ మధ్య నావిగేట్ చేయండి',
+        'Enter/Space': 'బటన్లు మరియు లింక్‌లను యాక్టివేట్ చేయండి',
+        'Arrow Keys': 'కాంపోనెంట్స్ లోపల నావిగేట్ చేయండి',
+        'Esc': 'డైలాగ్‌లు మరియు పాప్‌అప్‌లను మూసివేయండి'
+    })
+}
 
 class AccessibilityHelper:
     """Accessibility helper for ensuring the app is accessible to all users"""
@@ -66,83 +146,20 @@ class AccessibilityHelper:
     
     def _apply_accessibility_features(self):
         """Apply selected accessibility features"""
+        styles = []
+        
         if self.accessibility_features['high_contrast']:
-            self._apply_high_contrast()
+            styles.append(HIGH_CONTRAST_CSS)
         
         if self.accessibility_features['large_text']:
-            self._apply_large_text()
+            styles.append(LARGE_TEXT_CSS)
         
         if self.accessibility_features['screen_reader_mode']:
-            self._apply_screen_reader_optimizations()
-    
-    def _apply_high_contrast(self):
-        """Apply high contrast styling"""
-        st.markdown("""
-        <style>
-        .stApp {
-            background-color: #000000;
-            color: #FFFFFF;
-        }
-        .stButton > button {
-            background-color: #FFFFFF;
-            color: #000000;
-            border: 2px solid #FFFFFF;
-        }
-        .stSelectbox > div > div {
-            background-color: #000000;
-            color: #FFFFFF;
-        }
-        .stTextInput > div > div > input {
-            background-color: #000000;
-            color: #FFFFFF;
-            border: 2px solid #FFFFFF;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-    
-    def _apply_large_text(self):
-        """Apply large text styling"""
-        st.markdown("""
-        <style>
-        .stApp {
-            font-size: 18px;
-        }
-        h1 {
-            font-size: 3rem !important;
-        }
-        h2 {
-            font-size: 2.5rem !important;
-        }
-        h3 {
-            font-size: 2rem !important;
-        }
-        .stButton > button {
-            font-size: 18px;
-            padding: 12px 24px;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-    
-    def _apply_screen_reader_optimizations(self):
-        """Apply screen reader optimizations"""
-        # Add ARIA labels and roles
-        st.markdown("""
-        <style>
-        .stApp {
-            --sr-only: {
-                position: absolute;
-                width: 1px;
-                height: 1px;
-                padding: 0;
-                margin: -1px;
-                overflow: hidden;
-                clip: rect(0, 0, 0, 0);
-                white-space: nowrap;
-                border: 0;
-            }
-        }
-        </style>
-        """, unsafe_allow_html=True)
+            styles.append(SCREEN_READER_CSS)
+        
+        # Emit all active styles as a single element
+        if styles:
+            st.markdown(''.join(styles), unsafe_allow_html=True)
     
     def add_alt_text_for_images(self, image_description, language='english'):
         """Add alt text for images"""
@@ -209,19 +226,9 @@ class AccessibilityHelper:
     def get_keyboard_shortcuts(self, language='english'):
         """Get list of keyboard shortcuts"""
         if language == 'english':
-            return {
-                'Tab': 'Navigate between elements',
-                'Enter/Space': 'Activate buttons and links',
-                'Arrow Keys': 'Navigate within components',
-                'Esc': 'Close dialogs and popups'
-            }
+            return KEYBOARD_SHORTCUTS['english']
         else:
-            return {
-                'Tab': 'ఎలిమెంట్స్ మధ్య నావిగేట్ చేయండి',
-                'Enter/Space': 'బటన్లు మరియు లింక్‌లను యాక్టివేట్ చేయండి',
-                'Arrow Keys': 'కాంపోనెంట్స్ లోపల నావిగేట్ చేయండి',
-                'Esc': 'డైలాగ్‌లు మరియు పాప్‌అప్‌లను మూసివేయండి'
-            }
+            return KEYBOARD_SHORTCUTS['telugu']
     
     def render_keyboard_shortcuts_help(self, language='english'):
         """Render keyboard shortcuts help"""
@@ -1,10 +1,119 @@
 import os
+import re
 import json
-import csv
 import pandas as pd
 import streamlit as st
 from typing import List, Dict, Any
 
+# Fields matched by search_recipes and search_newspapers
+RECIPE_SEARCH_FIELDS = ('name', 'ingredients', 'instructions', 'cuisine')
+NEWSPAPER_SEARCH_FIELDS = ('title', 'content', 'category')
+
+# Recipe fields read from imported CSV files, in stored order
+RECIPE_CSV_COLUMNS = ['name', 'ingredients', 'instructions', 'cooking_time', 'difficulty', 'language', 'cuisine']
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# Units a cooking time has to mention to pass validation
+TIME_UNIT_PATTERN = re.compile(r'minute|hour|min|hr|నిమిషం|గంట', re.IGNORECASE)
+
+class SearchIndex:
+    """Case-folded inverted word index over the searchable fields of a list of records"""
+    
+    def __init__(self, fields):
+        self.fields = fields
+        self.words = {}
+        self.languages = {}
+        self.blobs = []
+        self.vocabulary = None
+    
+    def build(self, records):
+        """Index all records, replacing the previous contents"""
+        self.words = {}
+        self.languages = {}
+        self.blobs = []
+        self.vocabulary = None
+        
+        for record in records:
+            self.add(record)
+    
+    def add(self, record):
+        """Index a record appended to the end of the indexed list"""
+        self.blobs.append('')
+        self._index_record(len(self.blobs) - 1, record)
+    
+    def update(self, position, record):
+        """Re-index a single record after it was modified in place"""
+        for word in set(WORD_PATTERN.findall(self.blobs[position])):
+            word_positions = self.words[word]
+            word_positions.discard(position)
+            if not word_positions:
+                del self.words[word]
+        
+        for language_positions in self.languages.values():
+            language_positions.discard(position)
+        
+        self._index_record(position, record)
+    
+    def _index_record(self, position, record):
+        """Store the search blob and postings of a record"""
+        # Fields are joined with a control character so a query cannot match across fields
+        blob = '\x1f'.join(str(record.get(field) or '') for field in self.fields).casefold()
+        self.blobs[position] = blob
+        self.vocabulary = None
+        
+        for word in set(WORD_PATTERN.findall(blob)):
+            self.words.setdefault(word, set()).add(position)
+        self.languages.setdefault(record.get('language'), set()).add(position)
+    
+    def search(self, query, language=None):
+        """
+        Find records whose searchable fields contain the query
+        
+        Args:
+            query (str): Substring to look for, matched case-insensitively
+            language (str): Only return records in this language
+            
+        Returns:
+            list: Positions of the matching records, in list order
+        """
+        query = query.casefold()
+        candidates = self.languages.get(language, set()) if language else None
+        
+        # A record containing the query contains each query word inside one of its words
+        for query_word in set(WORD_PATTERN.findall(query)):
+            positions = set()
+            for word in self._words_containing(query_word):
+                positions |= self.words[word]
+            
+            candidates = positions if candidates is None else candidates & positions
+            if not candidates:
+                return []
+        
+        if candidates is None:
+            # Nothing to narrow down with, check every record
+            candidates = range(len(self.blobs))
+        
+        return [position for position in sorted(candidates) if query in self.blobs[position]]
+    
+    def _words_containing(self, query_word):
+        """Find indexed words containing query_word with one scan over the joined vocabulary"""
+        if self.vocabulary is None:
+            # Words never contain newlines, so they can delimit the joined words
+            self.vocabulary = '\n' + '\n'.join(self.words) + '\n'
+        
+        vocabulary = self.vocabulary
+        found = []
+        
+        index = vocabulary.find(query_word)
+        while index != -1:
+            start = vocabulary.rfind('\n', 0, index) + 1
+            end = vocabulary.find('\n', index)
+            found.append(vocabulary[start:end])
+            index = vocabulary.find(query_word, end)
+        
+        return found
+
 class DataHandler:
     """Data handling service for managing recipes and newspaper content"""
     
@@ -12,6 +121,11 @@ class DataHandler:
         self.data_source = data_source
         self.recipes_data = []
         self.newspapers_data = []
+        self.recipe_index = SearchIndex(RECIPE_SEARCH_FIELDS)
+        self.newspaper_index = SearchIndex(NEWSPAPER_SEARCH_FIELDS)
+        self.recipe_names = None
+        self.next_recipe_id = 1
+        self.recipe_positions = {}
         
         # Load data based on source
         self._load_data()
@@ -28,6 +142,23 @@ class DataHandler:
             # Initialize with empty data
             self.recipes_data = []
             self.newspapers_data = []
+        
+        self.recipe_names = None
+        self.next_recipe_id = max((r.get('id', 0) for r in self.recipes_data), default=0) + 1
+        self._build_search_indexes()
+    
+    def _build_search_indexes(self):
+        """Index recipes and newspaper articles for search"""
+        self._build_recipe_positions()
+        self.recipe_index.build(self.recipes_data)
+        self.newspaper_index.build(self.newspapers_data)
+    
+    def _build_recipe_positions(self):
+        """Map each recipe id to its position in the recipe list"""
+        self.recipe_positions = {}
+        for position, recipe in enumerate(self.recipes_data):
+            # Keep the first recipe when ids repeat, like a front-to-back scan would
+            self.recipe_positions.setdefault(recipe.get('id'), position)
     
     def _load_temporary_data(self):
         """Load temporary sample data"""
@@ -100,12 +231,20 @@ class DataHandler:
         """Get all recipes"""
         return self.recipes_data
     
+    def get_recipe_names(self) -> List[str]:
+        """Get display names of all recipes, in the same order as get_recipes()"""
+        if self.recipe_names is None:
+            self.recipe_names = [
+                recipe.get('name', f"Recipe {i+1}") for i, recipe in enumerate(self.recipes_data)
+            ]
+        return self.recipe_names
+    
     def get_recipe_by_id(self, recipe_id: int) -> Dict[str, Any]:
         """Get a specific recipe by ID"""
-        for recipe in self.recipes_data:
-            if recipe.get('id') == recipe_id:
-                return recipe
-        return {}
+        position = self.recipe_positions.get(recipe_id)
+        if position is None:
+            return {}
+        return self.recipes_data[position]
     
     def search_recipes(self, query: str, language: str = None) -> List[Dict[str, Any]]:
         """
@@ -121,26 +260,7 @@ class DataHandler:
         if not query:
             return self.recipes_data
         
-        query_lower = query.lower()
-        results = []
-        
-        for recipe in self.recipes_data:
-            # Check if query matches any field
-            matches = (
-                query_lower in recipe.get('name', '').lower() or
-                query_lower in recipe.get('ingredients', '').lower() or
-                query_lower in recipe.get('instructions', '').lower() or
-                query_lower in recipe.get('cuisine', '').lower()
-            )
-            
-            # Filter by language if specified
-            if language and recipe.get('language') != language:
-                continue
-            
-            if matches:
-                results.append(recipe)
-        
-        return results
+        return [self.recipes_data[position] for position in self.recipe_index.search(query, language)]
     
     def get_newspapers(self) -> List[Dict[str, Any]]:
         """Get all newspaper articles"""
@@ -160,34 +280,19 @@ class DataHandler:
         if not query:
             return self.newspapers_data
         
-        query_lower = query.lower()
-        results = []
-        
-        for article in self.newspapers_data:
-            # Check if query matches any field
-            matches = (
-                query_lower in article.get('title', '').lower() or
-                query_lower in article.get('content', '').lower() or
-                query_lower in article.get('category', '').lower()
-            )
-            
-            # Filter by language if specified
-            if language and article.get('language') != language:
-                continue
-            
-            if matches:
-                results.append(article)
-        
-        return results
+        return [self.newspapers_data[position] for position in self.newspaper_index.search(query, language)]
     
     def add_recipe(self, recipe_data: Dict[str, Any]) -> bool:
         """Add a new recipe"""
         try:
-            # Generate new ID
-            max_id = max([r.get('id', 0) for r in self.recipes_data] + [0])
-            recipe_data['id'] = max_id + 1
+            # Ids only ever increase, so deleted ids are never reused
+            recipe_data['id'] = self.next_recipe_id
+            self.next_recipe_id += 1
             
             self.recipes_data.append(recipe_data)
+            self.recipe_positions[recipe_data['id']] = len(self.recipes_data) - 1
+            self.recipe_index.add(recipe_data)
+            self.recipe_names = None
             self._save_data()
             return True
         except Exception as e:
@@ -197,12 +302,17 @@ class DataHandler:
     def update_recipe(self, recipe_id: int, updated_data: Dict[str, Any]) -> bool:
         """Update an existing recipe"""
         try:
-            for i, recipe in enumerate(self.recipes_data):
-                if recipe.get('id') == recipe_id:
-                    self.recipes_data[i].update(updated_data)
-                    self._save_data()
-                    return True
-            return False
+            position = self.recipe_positions.get(recipe_id)
+            if position is None:
+                return False
+            
+            self.recipes_data[position].update(updated_data)
+            if self.recipes_data[position].get('id') != recipe_id:
+                self._build_recipe_positions()
+            self.recipe_index.update(position, self.recipes_data[position])
+            self.recipe_names = None
+            self._save_data()
+            return True
         except Exception as e:
             st.error(f"Failed to update recipe: {str(e)}")
             return False
@@ -211,6 +321,9 @@ class DataHandler:
         """Delete a recipe"""
         try:
             self.recipes_data = [r for r in self.recipes_data if r.get('id') != recipe_id]
+            self._build_recipe_positions()
+            self.recipe_index.build(self.recipes_data)
+            self.recipe_names = None
             self._save_data()
             return True
         except Exception as e:
@@ -220,19 +333,24 @@ class DataHandler:
     def import_recipes_from_csv(self, csv_file) -> bool:
         """Import recipes from CSV file"""
         try:
-            df = pd.read_csv(csv_file)
+            # Read every cell as text so blanks come through as empty strings
+            df = pd.read_csv(csv_file, dtype=str, keep_default_na=False)
+            df = df.reindex(columns=RECIPE_CSV_COLUMNS, fill_value='')
+            df['language'] = df['language'].replace('', 'english')
             
-            for _, row in df.iterrows():
-                recipe = {
-                    'name': row.get('name', ''),
-                    'ingredients': row.get('ingredients', ''),
-                    'instructions': row.get('instructions', ''),
-                    'cooking_time': row.get('cooking_time', ''),
-                    'difficulty': row.get('difficulty', ''),
-                    'language': row.get('language', 'english'),
-                    'cuisine': row.get('cuisine', '')
-                }
-                self.add_recipe(recipe)
+            # Append all rows at once and write the data file a single time
+            recipes = df.to_dict('records')
+            for recipe_id, recipe in enumerate(recipes, start=self.next_recipe_id):
+                recipe['id'] = recipe_id
+            self.next_recipe_id += len(recipes)
+            
+            start = len(self.recipes_data)
+            self.recipes_data.extend(recipes)
+            for position, recipe in enumerate(recipes, start=start):
+                self.recipe_positions[recipe['id']] = position
+                self.recipe_index.add(recipe)
+            self.recipe_names = None
+            self._save_data()
             
             return True
         except Exception as e:
@@ -286,8 +404,11 @@ class DataHandler:
                 # Ensure directory exists
                 os.makedirs('data', exist_ok=True)
                 
-                with open('data/sample_data.json', 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                # Write a complete copy first so a failed save never leaves a truncated file
+                temp_path = 'data/sample_data.json.tmp'
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps(data, ensure_ascii=False, indent=2))
+                os.replace(temp_path, 'data/sample_data.json')
         except Exception as e:
             st.error(f"Failed to save data: {str(e)}")
     
@@ -309,8 +430,7 @@ class DataHandler:
         
         # Validate cooking time format
         cooking_time = recipe_data.get('cooking_time', '')
-        if cooking_time and not any(unit in cooking_time.lower() 
-                                   for unit in ['minute', 'hour', 'min', 'hr', 'నిమిషం', 'గంట']):
+        if cooking_time and not TIME_UNIT_PATTERN.search(cooking_time):
             errors.append("Cooking time should include time units")
         
         return errors
@@ -1,10 +1,78 @@
 import os
 import io
-import json
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
 import streamlit as st
-import requests
+import numpy as np
 from PIL import Image
 import base64
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from utils.http import create_session, REQUEST_TIMEOUT
+
+# Google Vision accepts at most 16 images per annotate request
+GOOGLE_VISION_BATCH_SIZE = 16
+
+# Shared worker pool for querying recognition providers concurrently
+RECOGNITION_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Number of recognition results kept per service, keyed by image content
+RECOGNITION_CACHE_SIZE = 128
+
+# Per-channel pixel variance below which an image is treated as blank
+UNIFORM_IMAGE_VARIANCE = 10
+
+# Largest image dimensions sent to the recognition providers
+UPLOAD_MAX_SIZE = (1024, 1024)
+
+# Food-related keywords for filtering results
+FOOD_KEYWORDS = (
+    'food', 'ingredient', 'vegetable', 'fruit', 'meat', 'spice', 'grain',
+    'dairy', 'herb', 'oil', 'rice', 'wheat', 'tomato', 'onion', 'potato',
+    'carrot', 'pepper', 'garlic', 'ginger', 'chicken', 'fish', 'egg',
+    'milk', 'cheese', 'yogurt', 'bread', 'flour', 'sugar', 'salt'
+)
+FOOD_PATTERN = re.compile('|'.join(re.escape(keyword) for keyword in FOOD_KEYWORDS))
+
+# Reference colors for the fallback color analysis
+COLOR_TO_INGREDIENTS = MappingProxyType({
+    # Red colors
+    (255, 0, 0): ('tomato', 'red pepper', 'strawberry'),
+    (200, 0, 0): ('tomato', 'red chili'),
+    # Green colors
+    (0, 255, 0): ('lettuce', 'spinach', 'green pepper'),
+    (0, 128, 0): ('broccoli', 'green beans', 'cucumber'),
+    # Orange colors
+    (255, 165, 0): ('carrot', 'orange', 'pumpkin'),
+    (255, 140, 0): ('carrot', 'sweet potato'),
+    # Yellow colors
+    (255, 255, 0): ('corn', 'banana', 'lemon'),
+    (255, 215, 0): ('corn', 'squash'),
+    # Brown colors
+    (139, 69, 19): ('potato', 'onion', 'mushroom'),
+    (160, 82, 45): ('bread', 'wheat', 'rice'),
+    # White colors
+    (255, 255, 255): ('rice', 'flour', 'milk', 'egg'),
+})
+COLOR_PALETTE = np.array(list(COLOR_TO_INGREDIENTS.keys()), dtype=np.int32)
+COLOR_PALETTE.flags.writeable = False
+COLOR_PALETTE_INGREDIENTS = tuple(COLOR_TO_INGREDIENTS.values())
+
+# Basic nutrition data for common ingredients, read-only and shared by every call
+NUTRITION_DB = MappingProxyType({
+    'tomato': MappingProxyType({'calories': 18, 'vitamin_c': 'high', 'lycopene': 'high'}),
+    'onion': MappingProxyType({'calories': 40, 'vitamin_c': 'medium', 'quercetin': 'high'}),
+    'carrot': MappingProxyType({'calories': 41, 'vitamin_a': 'very_high', 'beta_carotene': 'high'}),
+    'potato': MappingProxyType({'calories': 77, 'potassium': 'high', 'vitamin_c': 'medium'}),
+    'rice': MappingProxyType({'calories': 130, 'carbohydrates': 'high', 'protein': 'medium'}),
+    'chicken': MappingProxyType({'calories': 165, 'protein': 'very_high', 'vitamin_b6': 'high'}),
+})
+UNKNOWN_NUTRITION = MappingProxyType({
+    'calories': 'unknown',
+    'notes': 'Nutrition data not available'
+})
 
 class ImageRecognitionService:
     """Image recognition service for identifying food ingredients"""
@@ -14,13 +82,12 @@ class ImageRecognitionService:
         self.azure_computer_vision_key = os.getenv("AZURE_COMPUTER_VISION_KEY", None)
         self.azure_endpoint = os.getenv("AZURE_COMPUTER_VISION_ENDPOINT", None)
         
-        # Food-related keywords for filtering results
-        self.food_keywords = [
-            'food', 'ingredient', 'vegetable', 'fruit', 'meat', 'spice', 'grain',
-            'dairy', 'herb', 'oil', 'rice', 'wheat', 'tomato', 'onion', 'potato',
-            'carrot', 'pepper', 'garlic', 'ginger', 'chicken', 'fish', 'egg',
-            'milk', 'cheese', 'yogurt', 'bread', 'flour', 'sugar', 'salt'
-        ]
+        # Reuse connections across recognition requests
+        self.session = create_session(pool_connections=4, pool_maxsize=8)
+        
+        # Recent results keyed by image content hash, least recently used first
+        self.results_cache = OrderedDict()
+        self.results_cache_lock = threading.Lock()
     
     def identify_ingredients(self, image_file):
         """
@@ -33,86 +100,192 @@ class ImageRecognitionService:
             list: List of identified ingredients with confidence scores
         """
         try:
-            # Process image
-            image = Image.open(image_file)
+            # Byte-identical uploads reuse the previous analysis
+            image_bytes = image_file.getvalue() if hasattr(image_file, 'getvalue') else image_file.read()
+            cache_key = hashlib.blake2b(image_bytes, digest_size=16).digest()
+            
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                return cached
+            
+            # Process image, shrinking it before anything is uploaded
+            image = self.preprocess_image(Image.open(io.BytesIO(image_bytes)), max_size=UPLOAD_MAX_SIZE)
             
             # Try different APIs in order of preference
-            if self.google_vision_api_key:
-                return self._identify_with_google_vision(image)
+            if self._is_near_uniform(image):
+                # Blank or single-color images cannot show any ingredients
+                ingredients = []
+            elif self.google_vision_api_key and self.azure_computer_vision_key:
+                ingredients = self._identify_with_fastest_provider(image)
+            elif self.google_vision_api_key:
+                ingredients = self._identify_with_google_vision(image)
             elif self.azure_computer_vision_key:
-                return self._identify_with_azure(image)
+                ingredients = self._identify_with_azure(image)
             else:
                 # Fallback to basic image analysis
-                return self._identify_with_fallback(image)
+                ingredients = self._identify_with_fallback(image)
+            
+            self._store_cached_result(cache_key, ingredients)
+            return ingredients
                 
         except Exception as e:
             st.error(f"Image recognition failed: {str(e)}")
             return []
     
+    def _get_cached_result(self, cache_key):
+        """Return a copy of a cached recognition result, or None on a miss"""
+        with self.results_cache_lock:
+            ingredients = self.results_cache.get(cache_key)
+            if ingredients is None:
+                return None
+            self.results_cache.move_to_end(cache_key)
+        
+        # Hand out copies so callers cannot modify the cached entries
+        return [dict(ingredient) for ingredient in ingredients]
+    
+    def _store_cached_result(self, cache_key, ingredients):
+        """Cache a recognition result, evicting the least recently used entry when full"""
+        with self.results_cache_lock:
+            self.results_cache[cache_key] = [dict(ingredient) for ingredient in ingredients]
+            self.results_cache.move_to_end(cache_key)
+            if len(self.results_cache) > RECOGNITION_CACHE_SIZE:
+                self.results_cache.popitem(last=False)
+    
+    def _identify_with_fastest_provider(self, image):
+        """Query Google Vision and Azure concurrently and return the first non-empty result"""
+        # Decode once up front so both workers share the loaded pixels
+        image.load()
+        
+        futures = [
+            RECOGNITION_POOL.submit(self._identify_with_google_vision, image),
+            RECOGNITION_POOL.submit(self._identify_with_azure, image)
+        ]
+        
+        error = None
+        empty_result = None
+        for future in as_completed(futures):
+            try:
+                ingredients = future.result()
+            except Exception as e:
+                error = e
+                continue
+            
+            # An empty answer is not a success while the other provider may still find something
+            if ingredients:
+                return ingredients
+            empty_result = ingredients
+        
+        if empty_result is not None:
+            return empty_result
+        raise error
+    
+    def identify_ingredients_batch(self, image_files):
+        """
+        Identify ingredients from several uploaded images
+        
+        Args:
+            image_files: List of Streamlit uploaded file objects
+            
+        Returns:
+            list: One list of identified ingredients per image, in upload order
+        """
+        try:
+            images = [
+                self.preprocess_image(Image.open(image_file), max_size=UPLOAD_MAX_SIZE)
+                for image_file in image_files
+            ]
+            
+            if self.google_vision_api_key:
+                # Send the images in as few annotate requests as possible
+                results = []
+                for start in range(0, len(images), GOOGLE_VISION_BATCH_SIZE):
+                    batch = images[start:start + GOOGLE_VISION_BATCH_SIZE]
+                    results.extend(self._identify_batch_with_google_vision(batch))
+                return results
+            elif self.azure_computer_vision_key:
+                return [self._identify_with_azure(image) for image in images]
+            else:
+                return [self._identify_with_fallback(image) for image in images]
+                
+        except Exception as e:
+            st.error(f"Image recognition failed: {str(e)}")
+            return [[] for _ in image_files]
+    
     def _identify_with_google_vision(self, image):
         """Identify ingredients using Google Vision API"""
-        # Convert image to base64
-        img_buffer = io.BytesIO()
-        image.save(img_buffer, format='JPEG')
-        img_base64 = base64.b64encode(img_buffer.getvalue()).decode()
-        
+        return self._identify_batch_with_google_vision([image])[0]
+    
+    def _identify_batch_with_google_vision(self, images):
+        """Identify ingredients for up to GOOGLE_VISION_BATCH_SIZE images in one Google Vision request"""
         url = f"https://vision.googleapis.com/v1/images:annotate?key={self.google_vision_api_key}"
         
         data = {
-            'requests': [{
-                'image': {
-                    'content': img_base64
-                },
-                'features': [
-                    {'type': 'LABEL_DETECTION', 'maxResults': 20},
-                    {'type': 'OBJECT_LOCALIZATION', 'maxResults': 20}
-                ]
-            }]
+            'requests': [self._build_google_vision_request(image) for image in images]
         }
         
-        response = requests.post(url, json=data)
+        response = self.session.post(url, json=data, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
-            result = response.json()
-            ingredients = []
+            responses = response.json().get('responses', [])
             
-            # Process label annotations
-            if 'responses' in result and result['responses']:
-                annotations = result['responses'][0]
-                
-                # Process labels
-                if 'labelAnnotations' in annotations:
-                    for label in annotations['labelAnnotations']:
-                        description = label['description'].lower()
-                        score = label['score']
-                        
-                        if self._is_food_related(description):
-                            ingredients.append({
-                                'name': label['description'],
-                                'confidence': score,
-                                'type': 'label'
-                            })
-                
-                # Process objects
-                if 'localizedObjectAnnotations' in annotations:
-                    for obj in annotations['localizedObjectAnnotations']:
-                        name = obj['name'].lower()
-                        score = obj['score']
-                        
-                        if self._is_food_related(name):
-                            ingredients.append({
-                                'name': obj['name'],
-                                'confidence': score,
-                                'type': 'object'
-                            })
-            
-            # Remove duplicates and sort by confidence
-            ingredients = self._deduplicate_ingredients(ingredients)
-            return sorted(ingredients, key=lambda x: x['confidence'], reverse=True)
+            # Responses come back in request order
+            return [
+                self._parse_google_vision_annotations(responses[i] if i < len(responses) else {})
+                for i in range(len(images))
+            ]
         
         else:
             raise Exception(f"Google Vision API failed with status {response.status_code}")
     
+    def _build_google_vision_request(self, image):
+        """Build the annotate request entry for a single image"""
+        # Convert image to base64 straight from the buffer's memory
+        img_buffer = io.BytesIO()
+        image.save(img_buffer, format='JPEG', quality=85, subsampling=2, optimize=False)
+        img_base64 = base64.b64encode(img_buffer.getbuffer()).decode('ascii')
+        
+        return {
+            'image': {
+                'content': img_base64
+            },
+            'features': [
+                {'type': 'LABEL_DETECTION', 'maxResults': 20},
+                {'type': 'OBJECT_LOCALIZATION', 'maxResults': 20}
+            ]
+        }
+    
+    def _parse_google_vision_annotations(self, annotations):
+        """Extract food ingredients from one image's Google Vision annotations"""
+        ingredients = []
+        
+        # Process labels
+        if 'labelAnnotations' in annotations:
+            for label in annotations['labelAnnotations']:
+                description = label['description'].lower()
+                score = label['score']
+                
+                if self._is_food_related(description):
+                    ingredients.append({
+                        'name': label['description'],
+                        'confidence': score,
+                        'type': 'label'
+                    })
+        
+        # Process objects
+        if 'localizedObjectAnnotations' in annotations:
+            for obj in annotations['localizedObjectAnnotations']:
+                name = obj['name'].lower()
+                score = obj['score']
+                
+                if self._is_food_related(name):
+                    ingredients.append({
+                        'name': obj['name'],
+                        'confidence': score,
+                        'type': 'object'
+                    })
+        
+        return self._deduplicate_ingredients(ingredients)
+    
     def _identify_with_azure(self, image):
         """Identify ingredients using Azure Computer Vision"""
         img_buffer = io.BytesIO()
@@ -131,7 +304,7 @@ class ImageRecognitionService:
             'details': 'Food'
         }
         
-        response = requests.post(url, headers=headers, params=params, data=img_data)
+        response = self.session.post(url, headers=headers, params=params, data=img_data, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
             result = response.json()
@@ -163,8 +336,7 @@ class ImageRecognitionService:
                             'type': 'object'
                         })
             
-            ingredients = self._deduplicate_ingredients(ingredients)
-            return sorted(ingredients, key=lambda x: x['confidence'], reverse=True)
+            return self._deduplicate_ingredients(ingredients)
         
         else:
             raise Exception(f"Azure Computer Vision failed with status {response.status_code}")
@@ -177,34 +349,39 @@ class ImageRecognitionService:
         width, height = image.size
         mode = image.mode
         
-        # Get dominant colors
-        colors = self._get_dominant_colors(image)
+        # Get the reference colors covering most of the image
+        palette_indices = self._get_dominant_palette_colors(image)
         
         # Basic ingredient suggestions based on colors
-        ingredients = self._suggest_from_colors(colors)
+        ingredients = self._suggest_from_palette(palette_indices)
         
         return ingredients
     
+    def _is_near_uniform(self, image):
+        """Check if the image is blank or a single flat color, using a tiny thumbnail"""
+        thumbnail = np.asarray(image.resize((32, 32)).convert('RGB'), dtype=np.uint8)
+        
+        # Check each channel on its own, a saturated flat color differs a lot between channels
+        return thumbnail.reshape(-1, 3).var(axis=0).max() < UNIFORM_IMAGE_VARIANCE
+    
     def _is_food_related(self, text):
         """Check if text is food-related"""
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in self.food_keywords)
+        return FOOD_PATTERN.search(text.lower()) is not None
     
     def _deduplicate_ingredients(self, ingredients):
-        """Remove duplicate ingredients"""
-        seen = set()
-        unique_ingredients = []
+        """Remove duplicate ingredients, keeping the highest confidence entry for each name, best first"""
+        best = {}
         
         for ingredient in ingredients:
             name_lower = ingredient['name'].lower()
-            if name_lower not in seen:
-                seen.add(name_lower)
-                unique_ingredients.append(ingredient)
+            current = best.get(name_lower)
+            if current is None or ingredient['confidence'] > current['confidence']:
+                best[name_lower] = ingredient
         
-        return unique_ingredients
+        return sorted(best.values(), key=lambda x: x['confidence'], reverse=True)
     
-    def _get_dominant_colors(self, image, num_colors=5):
-        """Get dominant colors from image"""
+    def _get_color_sample(self, image):
+        """Get a small RGB copy of the image for color analysis"""
         # Resize image for faster processing
         image = image.resize((150, 150))
         
@@ -212,47 +389,32 @@ class ImageRecognitionService:
         if image.mode != 'RGB':
             image = image.convert('RGB')
         
-        # Get colors
-        colors = image.getcolors(maxcolors=256*256*256)
+        return image
+    
+    def _get_dominant_palette_colors(self, image, num_colors=5):
+        """Get the palette colors matching the most pixels, as indices into the reference palette"""
+        image = self._get_color_sample(image)
         
-        if colors:
-            # Sort by frequency and get top colors
-            colors.sort(key=lambda x: x[0], reverse=True)
-            return [color[1] for color in colors[:num_colors]]
+        # Assign every pixel to its closest palette color and count the pixels per palette color
+        pixels = np.asarray(image, dtype=np.int32).reshape(-1, 3)
+        counts = np.bincount(self._closest_palette_indices(pixels), minlength=len(COLOR_PALETTE))
         
-        return []
+        # Most matched palette colors first, skipping colors no pixel is closest to
+        top = np.argsort(-counts, kind='stable')[:num_colors]
+        return top[counts[top] > 0]
     
-    def _suggest_from_colors(self, colors):
-        """Suggest ingredients based on dominant colors"""
-        color_to_ingredients = {
-            # Red colors
-            (255, 0, 0): ['tomato', 'red pepper', 'strawberry'],
-            (200, 0, 0): ['tomato', 'red chili'],
-            # Green colors
-            (0, 255, 0): ['lettuce', 'spinach', 'green pepper'],
-            (0, 128, 0): ['broccoli', 'green beans', 'cucumber'],
-            # Orange colors
-            (255, 165, 0): ['carrot', 'orange', 'pumpkin'],
-            (255, 140, 0): ['carrot', 'sweet potato'],
-            # Yellow colors
-            (255, 255, 0): ['corn', 'banana', 'lemon'],
-            (255, 215, 0): ['corn', 'squash'],
-            # Brown colors
-            (139, 69, 19): ['potato', 'onion', 'mushroom'],
-            (160, 82, 45): ['bread', 'wheat', 'rice'],
-            # White colors
-            (255, 255, 255): ['rice', 'flour', 'milk', 'egg'],
-        }
-        
+    def _closest_palette_indices(self, colors):
+        """Find the closest reference palette color for every row of an (N, 3) int32 array"""
+        distances = ((COLOR_PALETTE[None, :, :] - colors[:, None, :]) ** 2).sum(axis=-1)
+        return distances.argmin(axis=1)
+    
+    def _suggest_from_palette(self, palette_indices):
+        """Suggest ingredients for reference palette colors"""
         ingredients = []
         
-        for color in colors:
-            # Find closest color match
-            closest_color = min(color_to_ingredients.keys(), 
-                              key=lambda c: sum((a-b)**2 for a, b in zip(color, c)))
-            
+        for closest in palette_indices:
             # Add ingredients for this color
-            for ingredient in color_to_ingredients[closest_color]:
+            for ingredient in COLOR_PALETTE_INGREDIENTS[closest]:
                 ingredients.append({
                     'name': ingredient,
                     'confidence': 0.5,  # Lower confidence for color-based detection
@@ -272,9 +434,13 @@ class ImageRecognitionService:
         Returns:
             PIL Image: Preprocessed image
         """
-        # Resize if too large
+        # Let the JPEG decoder scale down while decoding instead of decoding at full
+        # resolution; only takes effect before the first load, a no-op for other formats
+        image.draft('RGB', max_size)
+        
+        # Resize if too large; label detection does not need high quality resampling
         if image.size[0] > max_size[0] or image.size[1] > max_size[1]:
-            image.thumbnail(max_size, Image.Resampling.LANCZOS)
+            image.thumbnail(max_size, Image.Resampling.BILINEAR)
         
         # Convert to RGB if necessary
         if image.mode != 'RGB':
@@ -290,19 +456,6 @@ class ImageRecognitionService:
             ingredient_name (str): Name of the ingredient
             
         Returns:
-            dict: Basic nutrition information
+            Mapping: Basic nutrition information (read-only)
         """
-        # Basic nutrition data for common ingredients
-        nutrition_db = {
-            'tomato': {'calories': 18, 'vitamin_c': 'high', 'lycopene': 'high'},
-            'onion': {'calories': 40, 'vitamin_c': 'medium', 'quercetin': 'high'},
-            'carrot': {'calories': 41, 'vitamin_a': 'very_high', 'beta_carotene': 'high'},
-            'potato': {'calories': 77, 'potassium': 'high', 'vitamin_c': 'medium'},
-            'rice': {'calories': 130, 'carbohydrates': 'high', 'protein': 'medium'},
-            'chicken': {'calories': 165, 'protein': 'very_high', 'vitamin_b6': 'high'},
-        }
-        
-        return nutrition_db.get(ingredient_name.lower(), {
-            'calories': 'unknown',
-            'notes': 'Nutrition data not available'
-        })
+        return NUTRITION_DB.get(ingredient_name.lower(), UNKNOWN_NUTRITION)
@@ -1,8 +1,171 @@
 import os
-import json
 import random
+from bisect import bisect_right
+from collections import Counter
 import streamlit as st
-import requests
+from utils.http import create_session, REQUEST_TIMEOUT
+
+# Separates ingredients in joined search strings, so a match cannot span two ingredients
+INGREDIENT_SEPARATOR = '\x1f'
+
+class IngredientMatcher:
+    """Finds which records have an ingredient containing a given text"""
+    
+    def __init__(self, ingredient_lists):
+        self.record_count = len(ingredient_lists)
+        self.starts = []
+        self.owners = []
+        
+        parts = []
+        position = 0
+        for record, ingredients in enumerate(ingredient_lists):
+            for ingredient in ingredients:
+                ingredient = ingredient.lower()
+                self.starts.append(position)
+                self.owners.append(record)
+                parts.append(ingredient)
+                position += len(ingredient) + 1
+        
+        self.ingredients = parts
+        self.blob = INGREDIENT_SEPARATOR.join(parts)
+        
+        # Ingredients containing each two-character sequence, used to narrow down candidates
+        self.bigrams = {}
+        for i, ingredient in enumerate(parts):
+            for j in range(len(ingredient) - 1):
+                self.bigrams.setdefault(ingredient[j:j + 2], set()).add(i)
+    
+    def records_containing(self, text):
+        """
+        Find records with at least one ingredient containing text
+        
+        Args:
+            text (str): Lowercased text to look for
+            
+        Returns:
+            set: Indices of the matching records
+        """
+        if not text:
+            # The empty string is part of every ingredient
+            return set(self.owners)
+        
+        if len(text) >= 2:
+            return self._records_containing_by_bigrams(text)
+        
+        records = set()
+        blob = self.blob
+        
+        index = blob.find(text)
+        while index != -1:
+            ingredient = bisect_right(self.starts, index) - 1
+            records.add(self.owners[ingredient])
+            
+            # Continue after the matched ingredient, it cannot match twice
+            if ingredient + 1 == len(self.starts):
+                break
+            index = blob.find(text, self.starts[ingredient + 1])
+        
+        return records
+    
+    def _records_containing_by_bigrams(self, text):
+        """Find matching records by verifying only ingredients that contain every bigram of text"""
+        postings = []
+        for bigram in {text[j:j + 2] for j in range(len(text) - 1)}:
+            ingredients = self.bigrams.get(bigram)
+            if not ingredients:
+                return set()
+            postings.append(ingredients)
+        
+        # Intersect starting from the rarest bigram to keep the candidate set small
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        
+        return {self.owners[i] for i in candidates if text in self.ingredients[i]}
+
+# Recipe templates used for ingredient-based generation
+RECIPE_TEMPLATES = [
+    {
+        'name': 'Vegetable Curry',
+        'type': 'traditional',
+        'required_ingredients': ['vegetables', 'onion', 'tomato', 'spices'],
+        'optional_ingredients': ['garlic', 'ginger', 'coconut'],
+        'cooking_time': '30 minutes',
+        'difficulty': 'medium',
+        'instructions': '1. Heat oil in pan. 2. Add onions and cook until golden. 3. Add tomatoes and spices. 4. Add vegetables and cook until tender. 5. Serve hot with rice.'
+    },
+    {
+        'name': 'Rice Bowl',
+        'type': 'modern',
+        'required_ingredients': ['rice', 'vegetables', 'protein'],
+        'optional_ingredients': ['sauce', 'herbs', 'nuts'],
+        'cooking_time': '20 minutes',
+        'difficulty': 'easy',
+        'instructions': '1. Cook rice according to package instructions. 2. Prepare vegetables and protein. 3. Combine in bowl. 4. Add sauce and garnish.'
+    }
+]
+
+def _lower_template_ingredients(template):
+    """Lowercase a template's required and optional ingredient names"""
+    return (
+        tuple(ing.lower() for ing in template.get('required_ingredients', [])),
+        tuple(ing.lower() for ing in template.get('optional_ingredients', []))
+    )
+
+# Lowercased (required, optional) ingredients of the built-in templates, computed once,
+# keyed by template name together with the template they were computed from
+TEMPLATE_INGREDIENTS_LOWER = {
+    template['name']: (template, _lower_template_ingredients(template))
+    for template in RECIPE_TEMPLATES
+}
+
+# Traditional dish database
+TRADITIONAL_DISHES = [
+    {
+        'name': 'Dal Tadka',
+        'ingredients': ['lentils', 'onion', 'tomato', 'garlic', 'ginger', 'turmeric', 'cumin'],
+        'instructions': '1. Boil lentils with turmeric. 2. Prepare tadka with cumin, garlic, ginger. 3. Add onions and tomatoes. 4. Mix with cooked lentils.',
+        'cooking_time': '30 minutes',
+        'difficulty': 'easy',
+        'cultural_significance': 'Traditional Indian comfort food'
+    },
+    {
+        'name': 'Vegetable Biryani',
+        'ingredients': ['basmati rice', 'mixed vegetables', 'yogurt', 'biryani spices', 'fried onions'],
+        'instructions': '1. Soak rice. 2. Cook vegetables with spices. 3. Layer rice and vegetables. 4. Cook on dum.',
+        'cooking_time': '60 minutes',
+        'difficulty': 'hard',
+        'cultural_significance': 'Royal dish from Mughal cuisine'
+    }
+]
+
+# Cooking methods database
+COOKING_METHODS = [
+    'boiling', 'steaming', 'frying', 'sautéing', 'roasting', 'grilling',
+    'baking', 'pressure cooking', 'slow cooking', 'stir-frying'
+]
+
+# Built once, the dish database does not change at runtime
+DISH_MATCHER = IngredientMatcher([dish.get('ingredients', []) for dish in TRADITIONAL_DISHES])
+
+# Choices for the randomly generated recipe types
+RANDOM_RECIPE_TYPES = ('traditional', 'modern', 'fusion', 'healthy', 'quick')
+MODERN_DISHES = ('Bowl', 'Wrap', 'Salad', 'Stir-fry')
+MODERN_TECHNIQUES = (
+    'sous vide', 'air frying', 'pressure cooking', 'steaming',
+    'grilling', 'roasting', 'quick sautéing'
+)
+MODERN_INGREDIENTS = (
+    'quinoa', 'avocado', 'kale', 'chia seeds', 'coconut oil',
+    'almond milk', 'Greek yogurt', 'sweet potato', 'spinach'
+)
+FUSION_CUISINES = ('Indian', 'Italian', 'Mexican', 'Asian', 'Mediterranean')
+HEALTHY_DISHES = ('Power Bowl', 'Nutrition Wrap', 'Wellness Salad')
+HEALTHY_INGREDIENTS = (
+    'fresh vegetables', 'lean protein', 'whole grains', 'healthy fats',
+    'herbs and spices', 'low-fat dairy', 'legumes', 'nuts and seeds'
+)
+QUICK_DISHES = ('Meal', 'Fix', 'Bite', 'Dish')
+QUICK_METHODS = ('stir-fry', 'pan-sear', 'microwave', 'no-cook', 'one-pot')
 
 class RecipeGenerator:
     """Recipe generation service for creating traditional and modern dishes"""
@@ -11,10 +174,15 @@ class RecipeGenerator:
         self.openai_api_key = os.getenv("OPENAI_API_KEY", None)
         self.spoonacular_api_key = os.getenv("SPOONACULAR_API_KEY", None)
         
-        # Load recipe templates and patterns
-        self.recipe_templates = self._load_recipe_templates()
-        self.traditional_dishes = self._load_traditional_dishes()
-        self.cooking_methods = self._load_cooking_methods()
+        # Reuse connections across API calls
+        self.session = create_session()
+        
+        # Recipe templates and patterns are shared by every generator
+        self.recipe_templates = RECIPE_TEMPLATES
+        self.traditional_dishes = TRADITIONAL_DISHES
+        self.cooking_methods = COOKING_METHODS
+        self.dish_matcher = DISH_MATCHER
+        self.rng = random.Random()
         
     def generate_from_ingredients(self, ingredients):
         """
@@ -80,17 +248,16 @@ class RecipeGenerator:
         """
         suggestions = []
         
-        # Simple ingredient matching
-        for recipe in self.traditional_dishes:
+        # Count, per dish, how many of the given ingredients appear in its ingredient list
+        matches = Counter()
+        for ing in ingredients:
+            matches.update(self.dish_matcher.records_containing(ing.lower()))
+        
+        for i, recipe in enumerate(self.traditional_dishes):
             recipe_ingredients = recipe.get('ingredients', [])
             
-            # Check how many ingredients match
-            matches = sum(1 for ing in ingredients 
-                         if any(ing.lower() in recipe_ing.lower() 
-                               for recipe_ing in recipe_ingredients))
-            
             # If at least 50% of ingredients match, suggest the recipe
-            if matches >= len(recipe_ingredients) * 0.5:
+            if matches[i] >= len(recipe_ingredients) * 0.5:
                 suggestions.append(recipe['name'])
         
         return suggestions[:5]  # Return top 5 suggestions
@@ -107,53 +274,52 @@ class RecipeGenerator:
             'ignorePantry': True
         }
         
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
             recipes_data = response.json()
-            recipes = []
-            
-            for recipe_data in recipes_data:
-                # Get detailed recipe information
-                recipe_detail = self._get_spoonacular_recipe_detail(recipe_data['id'])
-                if recipe_detail:
-                    recipes.append(recipe_detail)
+            if not recipes_data:
+                return []
             
-            return recipes
+            # Get detailed recipe information for all recipes in one request
+            return self._get_spoonacular_recipe_details([recipe_data['id'] for recipe_data in recipes_data])
         else:
             raise Exception(f"Spoonacular API failed with status {response.status_code}")
     
-    def _get_spoonacular_recipe_detail(self, recipe_id):
-        """Get detailed recipe information from Spoonacular"""
-        url = f"https://api.spoonacular.com/recipes/{recipe_id}/information"
+    def _get_spoonacular_recipe_details(self, recipe_ids):
+        """Get detailed information for several recipes from Spoonacular with one bulk request"""
+        url = "https://api.spoonacular.com/recipes/informationBulk"
         
         params = {
             'apiKey': self.spoonacular_api_key,
+            'ids': ','.join(str(recipe_id) for recipe_id in recipe_ids),
             'includeNutrition': False
         }
         
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
-            data = response.json()
-            
-            # Extract instructions
-            instructions = []
-            if 'analyzedInstructions' in data and data['analyzedInstructions']:
-                for instruction_group in data['analyzedInstructions']:
-                    for step in instruction_group.get('steps', []):
-                        instructions.append(f"{step['number']}. {step['step']}")
-            
-            return {
-                'name': data.get('title', 'Unknown Recipe'),
-                'ingredients': [ing['original'] for ing in data.get('extendedIngredients', [])],
-                'instructions': ' '.join(instructions),
-                'cooking_time': f"{data.get('readyInMinutes', 'Unknown')} minutes",
-                'servings': data.get('servings', 'Unknown'),
-                'source': 'Spoonacular'
-            }
+            return [self._parse_spoonacular_recipe(data) for data in response.json()]
+        else:
+            raise Exception(f"Spoonacular API failed with status {response.status_code}")
+    
+    def _parse_spoonacular_recipe(self, data):
+        """Convert Spoonacular recipe information into a recipe"""
+        # Extract instructions
+        instructions = []
+        if 'analyzedInstructions' in data and data['analyzedInstructions']:
+            for instruction_group in data['analyzedInstructions']:
+                for step in instruction_group.get('steps', []):
+                    instructions.append(f"{step['number']}. {step['step']}")
         
-        return None
+        return {
+            'name': data.get('title', 'Unknown Recipe'),
+            'ingredients': [ing['original'] for ing in data.get('extendedIngredients', [])],
+            'instructions': ' '.join(instructions),
+            'cooking_time': f"{data.get('readyInMinutes', 'Unknown')} minutes",
+            'servings': data.get('servings', 'Unknown'),
+            'source': 'Spoonacular'
+        }
     
     def _generate_with_openai(self, ingredients):
         """Generate recipes using OpenAI API"""
@@ -165,15 +331,17 @@ class RecipeGenerator:
         """Generate recipes using local templates"""
         recipes = []
         
+        # Join the available ingredients so each check is a single substring search
+        available = INGREDIENT_SEPARATOR.join(avail_ing.lower() for avail_ing in ingredients)
+        
         # Filter templates based on available ingredients
         suitable_templates = []
         for template in self.recipe_templates:
-            template_ingredients = template.get('required_ingredients', [])
+            template_ingredients, _ = self._template_ingredients_lower(template)
             
             # Check if we have enough ingredients
             available_count = sum(1 for ing in template_ingredients
-                                if any(ing.lower() in avail_ing.lower() 
-                                      for avail_ing in ingredients))
+                                if ingredients and ing in available)
             
             if available_count >= len(template_ingredients) * 0.6:  # 60% match
                 suitable_templates.append(template)
@@ -186,6 +354,13 @@ class RecipeGenerator:
         
         return recipes
     
+    def _template_ingredients_lower(self, template):
+        """Get a template's lowercased (required, optional) ingredients, precomputed for built-in templates"""
+        entry = TEMPLATE_INGREDIENTS_LOWER.get(template.get('name'))
+        if entry is not None and entry[0] is template:
+            return entry[1]
+        return _lower_template_ingredients(template)
+    
     def _generate_from_template(self, template, available_ingredients):
         """Generate a recipe from a template"""
         recipe = {
@@ -197,21 +372,26 @@ class RecipeGenerator:
             'source': 'Generated'
         }
         
+        # Lowercase the available ingredients once for all comparisons below
+        available = [(avail_ing, avail_ing.lower()) for avail_ing in available_ingredients]
+        
+        required_lower, optional_lower = self._template_ingredients_lower(template)
+        
         # Build ingredients list
         ingredients_list = []
-        for req_ing in template.get('required_ingredients', []):
+        for req_ing, req_lower in zip(template.get('required_ingredients', []), required_lower):
             # Try to match with available ingredients
-            for avail_ing in available_ingredients:
-                if req_ing.lower() in avail_ing.lower() or avail_ing.lower() in req_ing.lower():
+            for avail_ing, avail_lower in available:
+                if req_lower in avail_lower or avail_lower in req_lower:
                     ingredients_list.append(avail_ing)
                     break
             else:
                 ingredients_list.append(req_ing)  # Add required ingredient anyway
         
         # Add optional ingredients if available
-        for opt_ing in template.get('optional_ingredients', []):
-            for avail_ing in available_ingredients:
-                if opt_ing.lower() in avail_ing.lower():
+        for opt_lower in optional_lower:
+            for avail_ing, avail_lower in available:
+                if opt_lower in avail_lower:
                     ingredients_list.append(avail_ing)
                     break
         
@@ -223,7 +403,7 @@ class RecipeGenerator:
     def _generate_traditional_recipe(self):
         """Generate a traditional recipe"""
         if self.traditional_dishes:
-            recipe = random.choice(self.traditional_dishes)
+            recipe = self.rng.choice(self.traditional_dishes)
             return {
                 'name': recipe['name'],
                 'type': 'Traditional',
@@ -238,21 +418,11 @@ class RecipeGenerator:
     
     def _generate_modern_recipe(self):
         """Generate a modern recipe"""
-        modern_techniques = [
-            'sous vide', 'air frying', 'pressure cooking', 'steaming',
-            'grilling', 'roasting', 'quick sautéing'
-        ]
-        
-        modern_ingredients = [
-            'quinoa', 'avocado', 'kale', 'chia seeds', 'coconut oil',
-            'almond milk', 'Greek yogurt', 'sweet potato', 'spinach'
-        ]
-        
         return {
-            'name': f"Modern {random.choice(['Bowl', 'Wrap', 'Salad', 'Stir-fry'])}",
+            'name': f"Modern {self.rng.choice(MODERN_DISHES)}",
             'type': 'Modern',
-            'ingredients': ', '.join(random.sample(modern_ingredients, 5)),
-            'instructions': f"1. Prepare ingredients using {random.choice(modern_techniques)}. 2. Combine in a modern style. 3. Season and serve fresh.",
+            'ingredients': ', '.join(self.rng.sample(MODERN_INGREDIENTS, 5)),
+            'instructions': f"1. Prepare ingredients using {self.rng.choice(MODERN_TECHNIQUES)}. 2. Combine in a modern style. 3. Season and serve fresh.",
             'cooking_time': '20 minutes',
             'difficulty': 'easy',
             'health_benefits': 'High in nutrients and antioxidants',
@@ -261,8 +431,7 @@ class RecipeGenerator:
     
     def _generate_fusion_recipe(self):
         """Generate a fusion recipe"""
-        cuisines = ['Indian', 'Italian', 'Mexican', 'Asian', 'Mediterranean']
-        fusion_pair = random.sample(cuisines, 2)
+        fusion_pair = self.rng.sample(FUSION_CUISINES, 2)
         
         return {
             'name': f"{fusion_pair[0]}-{fusion_pair[1]} Fusion Dish",
@@ -277,15 +446,10 @@ class RecipeGenerator:
     
     def _generate_healthy_recipe(self):
         """Generate a healthy recipe"""
-        healthy_ingredients = [
-            'fresh vegetables', 'lean protein', 'whole grains', 'healthy fats',
-            'herbs and spices', 'low-fat dairy', 'legumes', 'nuts and seeds'
-        ]
-        
         return {
-            'name': f"Healthy {random.choice(['Power Bowl', 'Nutrition Wrap', 'Wellness Salad'])}",
+            'name': f"Healthy {self.rng.choice(HEALTHY_DISHES)}",
             'type': 'Healthy',
-            'ingredients': ', '.join(random.sample(healthy_ingredients, 4)),
+            'ingredients': ', '.join(self.rng.sample(HEALTHY_INGREDIENTS, 4)),
             'instructions': "1. Choose fresh, organic ingredients. 2. Use minimal oil and healthy cooking methods. 3. Balance proteins, carbs, and healthy fats.",
             'cooking_time': '25 minutes',
             'difficulty': 'easy',
@@ -296,13 +460,11 @@ class RecipeGenerator:
     
     def _generate_quick_recipe(self):
         """Generate a quick recipe"""
-        quick_methods = ['stir-fry', 'pan-sear', 'microwave', 'no-cook', 'one-pot']
-        
         return {
-            'name': f"Quick {random.choice(['Meal', 'Fix', 'Bite', 'Dish'])}",
+            'name': f"Quick {self.rng.choice(QUICK_DISHES)}",
             'type': 'Quick',
             'ingredients': 'Ready-to-use ingredients, pre-cooked items',
-            'instructions': f"Use {random.choice(quick_methods)} method for fastest preparation.",
+            'instructions': f"Use {self.rng.choice(QUICK_METHODS)} method for fastest preparation.",
             'cooking_time': '10 minutes',
             'difficulty': 'very easy',
             'prep_time': '5 minutes',
@@ -311,56 +473,4 @@ class RecipeGenerator:
     
     def _generate_random_recipe(self):
         """Generate a random recipe"""
-        types = ['traditional', 'modern', 'fusion', 'healthy', 'quick']
-        return self.generate_by_type(random.choice(types))
-    
-    def _load_recipe_templates(self):
-        """Load recipe templates"""
-        return [
-            {
-                'name': 'Vegetable Curry',
-                'type': 'traditional',
-                'required_ingredients': ['vegetables', 'onion', 'tomato', 'spices'],
-                'optional_ingredients': ['garlic', 'ginger', 'coconut'],
-                'cooking_time': '30 minutes',
-                'difficulty': 'medium',
-                'instructions': '1. Heat oil in pan. 2. Add onions and cook until golden. 3. Add tomatoes and spices. 4. Add vegetables and cook until tender. 5. Serve hot with rice.'
-            },
-            {
-                'name': 'Rice Bowl',
-                'type': 'modern',
-                'required_ingredients': ['rice', 'vegetables', 'protein'],
-                'optional_ingredients': ['sauce', 'herbs', 'nuts'],
-                'cooking_time': '20 minutes',
-                'difficulty': 'easy',
-                'instructions': '1. Cook rice according to package instructions. 2. Prepare vegetables and protein. 3. Combine in bowl. 4. Add sauce and garnish.'
-            }
-        ]
-    
-    def _load_traditional_dishes(self):
-        """Load traditional dish database"""
-        return [
-            {
-                'name': 'Dal Tadka',
-                'ingredients': ['lentils', 'onion', 'tomato', 'garlic', 'ginger', 'turmeric', 'cumin'],
-                'instructions': '1. Boil lentils with turmeric. 2. Prepare tadka with cumin, garlic, ginger. 3. Add onions and tomatoes. 4. Mix with cooked lentils.',
-                'cooking_time': '30 minutes',
-                'difficulty': 'easy',
-                'cultural_significance': 'Traditional Indian comfort food'
-            },
-            {
-                'name': 'Vegetable Biryani',
-                'ingredients': ['basmati rice', 'mixed vegetables', 'yogurt', 'biryani spices', 'fried onions'],
-                'instructions': '1. Soak rice. 2. Cook vegetables with spices. 3. Layer rice and vegetables. 4. Cook on dum.',
-                'cooking_time': '60 minutes',
-                'difficulty': 'hard',
-                'cultural_significance': 'Royal dish from Mughal cuisine'
-            }
-        ]
-    
-    def _load_cooking_methods(self):
-        """Load cooking methods database"""
-        return [
-            'boiling', 'steaming', 'frying', 'sautéing', 'roasting', 'grilling',
-            'baking', 'pressure cooking', 'slow cooking', 'stir-frying'
-        ]
+        return self.generate_by_type(self.rng.choice(RANDOM_RECIPE_TYPES))
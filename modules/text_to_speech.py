@@ -1,9 +1,33 @@
 import os
 import io
+import base64
+import hashlib
 import tempfile
 import streamlit as st
 from gtts import gTTS
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from utils.http import create_session, REQUEST_TIMEOUT
+from utils.disk_cache import DiskCache
+
+# Google Cloud TTS voices per language code
+GOOGLE_VOICES = {
+    'en': {'languageCode': 'en-US', 'name': 'en-US-Standard-D'},
+    'te': {'languageCode': 'te-IN', 'name': 'te-IN-Standard-A'}
+}
+
+# Language codes understood by gTTS
+GTTS_LANGUAGES = {
+    'te': 'te',  # Telugu
+    'en': 'en',  # English
+    'hi': 'hi',  # Hindi
+    'ta': 'ta',  # Tamil
+}
+
+# Shown when Telugu speech could not be generated and English was used instead
+TELUGU_FALLBACK_WARNING = "Telugu TTS not available, using English"
+
+# Shared worker pool for synthesizing chunks of long texts concurrently
+TTS_POOL = ThreadPoolExecutor(max_workers=8)
 
 class TTSService:
     """Text-to-Speech service using gTTS and fallback options"""
@@ -12,6 +36,12 @@ class TTSService:
         self.google_api_key = os.getenv("GOOGLE_CLOUD_TTS_API_KEY", None)
         self.use_google_api = self.google_api_key is not None
         
+        # Reuse connections across API calls
+        self.session = create_session()
+        
+        # Synthesized audio kept across restarts
+        self.audio_cache = DiskCache('audio', max_entries=500)
+        
     def generate_audio(self, text, language='en', slow=False):
         """
         Generate audio from text
@@ -28,35 +58,113 @@ class TTSService:
             return None
             
         try:
-            # Use Google Cloud TTS API if available
-            if self.use_google_api and language in ['en', 'te']:
-                return self._generate_with_google_api(text, language, slow)
-            else:
-                # Use gTTS as fallback
-                return self._generate_with_gtts(text, language, slow)
+            return self.synthesize(text, language, slow)
                 
         except Exception as e:
             st.error(f"Audio generation failed: {str(e)}")
             return None
     
+    def synthesize(self, text, language='en', slow=False):
+        """
+        Generate audio from text, raising on failure
+        
+        Args:
+            text (str): Text to convert to speech
+            language (str): Language code ('en', 'te', etc.)
+            slow (bool): Whether to speak slowly
+            
+        Returns:
+            bytes: Audio file content
+        """
+        audio_content, fell_back = self._synthesize(text, language, slow)
+        if fell_back:
+            st.warning(TELUGU_FALLBACK_WARNING)
+        return audio_content
+    
+    def _synthesize(self, text, language, slow):
+        """
+        Generate audio from text without touching the page, so it can run on worker threads
+        
+        Returns:
+            tuple: (audio bytes, whether English audio was substituted for the requested language)
+        """
+        use_google_api = self.use_google_api and language in ['en', 'te']
+        
+        cache_key = DiskCache.make_key(use_google_api, language, slow, text)
+        audio_content = self.audio_cache.get(cache_key)
+        if audio_content is not None:
+            return audio_content, False
+        
+        # Use Google Cloud TTS API if available
+        if use_google_api:
+            audio_content = self._generate_with_google_api(text, language, slow)
+            fell_back = False
+        else:
+            # Use gTTS as fallback
+            audio_content, used_language = self._generate_with_gtts(text, language, slow)
+            fell_back = used_language != GTTS_LANGUAGES.get(language, 'en')
+        
+        # Substituted audio is not what this key asks for, so keep it out of the cache
+        if not fell_back:
+            self.audio_cache.set(cache_key, audio_content)
+        return audio_content, fell_back
+    
+    def generate_audio_long(self, text, language='en', slow=False):
+        """
+        Generate audio for text of any length
+        
+        Args:
+            text (str): Text to convert to speech
+            language (str): Language code ('en', 'te', etc.)
+            slow (bool): Whether to speak slowly
+            
+        Returns:
+            bytes: Audio file content or None if failed
+        """
+        if not text or not text.strip():
+            return None
+        
+        try:
+            return self.synthesize_long(text, language, slow)
+        
+        except Exception as e:
+            st.error(f"Audio generation failed: {str(e)}")
+            return None
+    
+    def synthesize_long(self, text, language='en', slow=False):
+        """
+        Generate audio for text of any length, raising on failure
+        
+        Args:
+            text (str): Text to convert to speech
+            language (str): Language code ('en', 'te', etc.)
+            slow (bool): Whether to speak slowly
+            
+        Returns:
+            bytes: Audio file content
+        """
+        chunks = self.chunk_text(text)
+        if len(chunks) == 1:
+            return self.synthesize(chunks[0], language, slow)
+        
+        # Chunks are independent requests, so synthesize them concurrently
+        futures = [TTS_POOL.submit(self._synthesize, chunk, language, slow) for chunk in chunks]
+        results = [future.result() for future in futures]
+        
+        # Pool threads cannot write to the page, so report a fallback from here
+        if any(fell_back for _, fell_back in results):
+            st.warning(TELUGU_FALLBACK_WARNING)
+        
+        # MP3 frame streams stay playable when concatenated
+        return b''.join(audio_content for audio_content, _ in results)
+    
     def _generate_with_google_api(self, text, language, slow):
         """Generate audio using Google Cloud TTS API"""
         url = f"https://texttospeech.googleapis.com/v1/text:synthesize?key={self.google_api_key}"
         
-        # Map language codes for Google API
-        lang_map = {
-            'en': 'en-US',
-            'te': 'te-IN'
-        }
-        
-        voice_map = {
-            'en': {'languageCode': 'en-US', 'name': 'en-US-Standard-D'},
-            'te': {'languageCode': 'te-IN', 'name': 'te-IN-Standard-A'}
-        }
-        
         data = {
             'input': {'text': text},
-            'voice': voice_map.get(language, voice_map['en']),
+            'voice': GOOGLE_VOICES.get(language, GOOGLE_VOICES['en']),
             'audioConfig': {
                 'audioEncoding': 'MP3',
                 'speakingRate': 0.75 if slow else 1.0
@@ -64,51 +172,45 @@ class TTSService:
         }
         
         headers = {'Content-Type': 'application/json'}
-        response = requests.post(url, json=data, headers=headers)
+        response = self.session.post(url, json=data, headers=headers, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
             result = response.json()
-            import base64
             audio_content = base64.b64decode(result['audioContent'])
             return audio_content
         else:
             raise Exception(f"Google API request failed with status {response.status_code}")
     
     def _generate_with_gtts(self, text, language, slow):
-        """Generate audio using gTTS"""
-        # Map language codes for gTTS
-        lang_map = {
-            'te': 'te',  # Telugu
-            'en': 'en',  # English
-            'hi': 'hi',  # Hindi
-            'ta': 'ta',  # Tamil
-        }
+        """
+        Generate audio using gTTS
         
-        gtts_lang = lang_map.get(language, 'en')
+        Returns:
+            tuple: (audio bytes, gTTS language code the audio was actually spoken in)
+        """
+        gtts_lang = GTTS_LANGUAGES.get(language, 'en')
         
         try:
-            # Create gTTS object
-            tts = gTTS(text=text, lang=gtts_lang, slow=slow)
-            
-            # Save to bytes buffer
-            audio_buffer = io.BytesIO()
-            tts.write_to_fp(audio_buffer)
-            audio_buffer.seek(0)
-            
-            return audio_buffer.getvalue()
+            return self._gtts_audio(text, gtts_lang, slow), gtts_lang
             
         except Exception as e:
             # If Telugu is not supported, try English
             if language == 'te':
-                st.warning("Telugu TTS not available, using English")
-                tts = gTTS(text=text, lang='en', slow=slow)
-                audio_buffer = io.BytesIO()
-                tts.write_to_fp(audio_buffer)
-                audio_buffer.seek(0)
-                return audio_buffer.getvalue()
+                return self._gtts_audio(text, 'en', slow), 'en'
             else:
                 raise e
     
+    def _gtts_audio(self, text, gtts_lang, slow):
+        """Synthesize text with gTTS into MP3 bytes"""
+        tts = gTTS(text=text, lang=gtts_lang, slow=slow)
+        
+        # Save to bytes buffer
+        audio_buffer = io.BytesIO()
+        tts.write_to_fp(audio_buffer)
+        audio_buffer.seek(0)
+        
+        return audio_buffer.getvalue()
+    
     def get_supported_languages(self):
         """Get list of supported languages for TTS"""
         return {
@@ -131,12 +233,18 @@ class TTSService:
         Returns:
             str: Path to saved file
         """
-        if not filename:
-            filename = f"tts_audio_{hash(audio_content)}.mp3"
+        content_named = not filename
+        if content_named:
+            # Name files by content so identical audio maps to the same file across restarts
+            filename = f"tts_audio_{hashlib.blake2b(audio_content, digest_size=16).hexdigest()}.mp3"
         
         temp_dir = tempfile.gettempdir()
         file_path = os.path.join(temp_dir, filename)
         
+        # A content-named file that already exists holds exactly this audio
+        if content_named and os.path.exists(file_path):
+            return file_path
+        
         with open(file_path, 'wb') as f:
             f.write(audio_content)
         
@@ -170,18 +278,23 @@ class TTSService:
             return [text]
         
         chunks = []
-        sentences = text.split('. ')
-        current_chunk = ""
         
-        for sentence in sentences:
-            if len(current_chunk + sentence) <= chunk_size:
-                current_chunk += sentence + ". "
+        # Collect the pieces of the current chunk and join them once, tracking its length separately
+        current_chunk = []
+        current_length = 0
+        
+        for sentence in text.split('. '):
+            piece = sentence + ". "
+            if current_length + len(sentence) <= chunk_size:
+                current_chunk.append(piece)
+                current_length += len(piece)
             else:
                 if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence + ". "
+                    chunks.append(''.join(current_chunk).strip())
+                current_chunk = [piece]
+                current_length = len(piece)
         
         if current_chunk:
-            chunks.append(current_chunk.strip())
+            chunks.append(''.join(current_chunk).strip())
         
         return chunks
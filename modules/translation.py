@@ -1,8 +1,21 @@
 import os
 import streamlit as st
 from googletrans import Translator
-import requests
-import json
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from utils.http import create_session, REQUEST_TIMEOUT
+from utils.disk_cache import DiskCache
+
+# Shared worker pool for overlapping independent translation requests
+TRANSLATE_POOL = ThreadPoolExecutor(max_workers=8)
+
+# Separate pool for background cache warming; prefetches wait on TRANSLATE_POOL
+# work, so running them on that same bounded pool could starve it
+PREFETCH_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Per-request limits of the Google Translate v2 API
+API_MAX_TEXTS_PER_REQUEST = 128
+API_MAX_CHARS_PER_REQUEST = 30000
 
 class TranslationService:
     """Translation service using Google Translate or fallback APIs"""
@@ -12,6 +25,15 @@ class TranslationService:
         self.api_key = os.getenv("GOOGLE_TRANSLATE_API_KEY", None)
         self.use_api = self.api_key is not None
 
+        # Reuse connections across API calls
+        self.session = create_session()
+
+        # Translations kept across restarts
+        self.disk_cache = DiskCache('translations')
+
+        # Successful single-text translations, keyed by (text, target_language)
+        self._translate_cached = lru_cache(maxsize=4096)(self._translate_uncached)
+
     def translate_text(self, text, target_language):
         """
         Translate text to target language
@@ -23,18 +45,46 @@ class TranslationService:
         Returns:
             str: Translated text
         """
-        if not text or not text.strip():
-            return ""
-
         try:
-            if self.use_api:
-                return self._translate_with_api(text, target_language)
-            else:
-                return self._translate_with_library(text, target_language)
+            return self._translate_or_raise(text, target_language)
         except Exception as e:
             st.error(f"Translation error: {str(e)}")
             return text
 
+    def _translate_or_raise(self, text, target_language):
+        """Translate a single text without reporting errors to the UI"""
+        if not text or not text.strip():
+            return ""
+
+        if self._is_in_language(text, target_language):
+            return text
+
+        return self._translate_cached(text, target_language)
+
+    def _is_in_language(self, text, target_language):
+        """Cheaply check if text is already written in the target language, by script"""
+        if target_language == 'te':
+            # Every letter is in the Telugu Unicode block
+            return all('\u0c00' <= char <= '\u0c7f' for char in text if char.isalpha())
+        if target_language == 'en':
+            return text.isascii()
+        return False
+
+    def _translate_uncached(self, text, target_language):
+        """Translate text with the configured backend, raising on failure so errors are not cached"""
+        cache_key = DiskCache.make_key(target_language, text)
+        translated = self.disk_cache.get(cache_key)
+        if translated is not None:
+            return translated
+
+        if self.use_api:
+            translated = self._translate_with_api(text, target_language)
+        else:
+            translated = self._translate_with_library(text, target_language)
+
+        self.disk_cache.set(cache_key, translated)
+        return translated
+
     def _translate_with_api(self, text, target_language):
         """Translate using Google Translate API"""
         url = "https://translation.googleapis.com/language/translate/v2"
@@ -46,7 +96,7 @@ class TranslationService:
             'format': 'text'
         }
 
-        response = requests.post(url, data=params)
+        response = self.session.post(url, data=params, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 200:
             result = response.json()
@@ -54,6 +104,106 @@ class TranslationService:
         else:
             raise Exception(f"API request failed with status {response.status_code}")
 
+    def translate_batch(self, texts, target_language):
+        """
+        Translate several texts with a single request
+
+        Args:
+            texts (list): List of texts to translate
+            target_language (str): Target language code
+
+        Returns:
+            list: Translated texts in the same order as the input
+
+        Raises:
+            Exception: If the underlying translation request fails
+        """
+        translated = [""] * len(texts)
+        pending = []
+
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            if self._is_in_language(text, target_language):
+                # Nothing to translate, keep the text as it is
+                translated[i] = text
+            else:
+                pending.append(i)
+
+        # Texts translated before, possibly by an earlier process
+        cache_keys = {i: DiskCache.make_key(target_language, texts[i]) for i in pending}
+        missing = []
+        for i in pending:
+            cached = self.disk_cache.get(cache_keys[i])
+            if cached is None:
+                missing.append(i)
+            else:
+                translated[i] = cached
+        pending = missing
+
+        if not pending:
+            return translated
+
+        pending_texts = [texts[i] for i in pending]
+        if self.use_api:
+            results = []
+            for chunk in self._split_for_api(pending_texts):
+                results.extend(self._translate_batch_with_api(chunk, target_language))
+        else:
+            results = self._translate_batch_with_library(pending_texts, target_language)
+
+        for i, result in zip(pending, results):
+            translated[i] = result
+
+        self.disk_cache.set_many([(cache_keys[i], translated[i]) for i in pending])
+        return translated
+
+    def _split_for_api(self, texts):
+        """Group texts into runs that fit within a single API request"""
+        chunks = []
+        chunk = []
+        chunk_chars = 0
+
+        for text in texts:
+            if chunk and (len(chunk) == API_MAX_TEXTS_PER_REQUEST
+                          or chunk_chars + len(text) > API_MAX_CHARS_PER_REQUEST):
+                chunks.append(chunk)
+                chunk = []
+                chunk_chars = 0
+
+            chunk.append(text)
+            chunk_chars += len(text)
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+    def _translate_batch_with_api(self, texts, target_language):
+        """Translate a list of texts in one Google Translate API request"""
+        url = "https://translation.googleapis.com/language/translate/v2"
+
+        # The v2 endpoint accepts the 'q' parameter repeated once per text
+        params = [('key', self.api_key), ('target', target_language), ('format', 'text')]
+        params.extend(('q', text) for text in texts)
+
+        response = self.session.post(url, data=params, timeout=REQUEST_TIMEOUT)
+
+        if response.status_code == 200:
+            result = response.json()
+            return [item['translatedText'] for item in result['data']['translations']]
+        else:
+            raise Exception(f"API request failed with status {response.status_code}")
+
+    def _translate_batch_with_library(self, texts, target_language):
+        """Translate a list of texts using googletrans library"""
+        # googletrans sends one request per text, so overlap them on the pool
+        futures = [
+            TRANSLATE_POOL.submit(self._translate_with_library, text, target_language)
+            for text in texts
+        ]
+        return [future.result() for future in futures]
+
     def _translate_with_library(self, text, target_language):
         """Translate using googletrans library (sync version)"""
         try:
@@ -90,7 +240,7 @@ class TranslationService:
             'q': text
         }
 
-        response = requests.post(url, data=params)
+        response = self.session.post(url, data=params, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 200:
             result = response.json()
@@ -125,14 +275,24 @@ class TranslationService:
         Returns:
             list: List of translated texts
         """
+        try:
+            return self.translate_batch(texts, target_language)
+        except Exception:
+            # Fall back to translating one text at a time
+            pass
+
         translated_texts = []
+        failed = 0
 
         for text in texts:
             try:
-                translated = self.translate_text(text, target_language)
-                translated_texts.append(translated)
-            except Exception as e:
-                st.warning(f"Failed to translate text: {text[:50]}...")
+                translated_texts.append(self._translate_or_raise(text, target_language))
+            except Exception:
+                failed += 1
                 translated_texts.append(text)
 
+        # Report all failures at once instead of one message per text
+        if failed:
+            st.warning(f"Failed to translate {failed} of {len(texts)} texts")
+
         return translated_texts
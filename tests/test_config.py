@@ -0,0 +1,124 @@
+import os
+import json
+import tempfile
+import threading
+import unittest
+from unittest import mock
+import streamlit as st
+from utils.config import Config
+
+class ConfigSaveTest(unittest.TestCase):
+    """Config writes batched changes atomically and without losing other writers' changes"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.config_file = os.path.join(self.directory.name, 'config.json')
+
+    def _config(self):
+        config = Config()
+        config.config_file = self.config_file
+        config.get('data_source')
+        self.addCleanup(config._flush)
+        return config
+
+    def _saved(self, key):
+        with open(self.config_file, encoding='utf-8') as f:
+            value = json.load(f)
+        for part in key.split('.'):
+            value = value[part]
+        return value
+
+    def test_batch_is_written_once_when_it_ends(self):
+        config = self._config()
+
+        with mock.patch.object(Config, '_write_config', autospec=True, side_effect=Config._write_config) as write:
+            with config.batch_updates():
+                config.set('app_settings.max_file_size_mb', 20)
+                config.set('ui_settings.theme', 'dark')
+                config.data_source = 'production'
+                self.assertIsNone(config._save_timer)
+                self.assertEqual(self._saved('app_settings.max_file_size_mb'), 10)
+
+        write.assert_called_once()
+        self.assertEqual(self._saved('app_settings.max_file_size_mb'), 20)
+        self.assertEqual(self._saved('ui_settings.theme'), 'dark')
+        self.assertEqual(self._saved('data_source'), 'production')
+        self.assertFalse(os.path.exists(self.config_file + '.tmp'))
+
+    def test_overlapping_batches_on_two_threads(self):
+        config = self._config()
+        first_open = threading.Event()
+        second_open = threading.Event()
+        first_closed = threading.Event()
+
+        # The first batch closes while the second is still open
+        def first_batch():
+            with config.batch_updates():
+                first_open.set()
+                second_open.wait()
+            first_closed.set()
+
+        def second_batch():
+            first_open.wait()
+            with config.batch_updates():
+                second_open.set()
+                first_closed.wait()
+                config.set('ui_settings.theme', 'dark')
+
+        threads = [threading.Thread(target=first_batch), threading.Thread(target=second_batch)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # The last batch to close wrote the change, and later changes are scheduled again
+        self.assertEqual(self._saved('ui_settings.theme'), 'dark')
+        config.set('ui_settings.theme', 'light')
+        self.assertIsNotNone(config._save_timer)
+        self.assertIsNone(config._flush())
+        self.assertEqual(self._saved('ui_settings.theme'), 'light')
+
+    def test_write_is_not_skipped_after_another_writer(self):
+        first = self._config()
+        second = self._config()
+
+        first.set('app_settings.max_file_size_mb', 20)
+        first._flush()
+        second.set('app_settings.max_file_size_mb', 30)
+        second._flush()
+        first.set('app_settings.max_file_size_mb', 20)
+        first._flush()
+
+        self.assertEqual(self._saved('app_settings.max_file_size_mb'), 20)
+
+    def test_unsaved_changes_stay_in_their_instance(self):
+        with open(self.config_file, 'w', encoding='utf-8') as f:
+            json.dump({'data_source': 'temporary', 'custom': {'values': [1]}}, f)
+
+        first = self._config()
+        with first.batch_updates():
+            first.set('custom.a', 99)
+            first.get('custom.values').append(2)
+
+            second = self._config()
+            self.assertIsNone(second.get('custom.a'))
+            self.assertEqual(second.get('custom.values'), [1])
+
+    def test_background_error_is_reported_on_next_set(self):
+        config = self._config()
+        config.config_file = os.path.join(self.directory.name, 'missing', 'config.json')
+
+        config.set('ui_settings.theme', 'dark')
+        config._flush_in_background()
+
+        config.config_file = self.config_file
+        with mock.patch.object(st, 'error') as error:
+            config.set('ui_settings.theme', 'light')
+        error.assert_called_once()
+
+        self.assertIsNone(config._flush())
+        self.assertEqual(self._saved('ui_settings.theme'), 'light')
+
+if __name__ == '__main__':
+    unittest.main()
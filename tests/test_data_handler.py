@@ -0,0 +1,68 @@
+import random
+import unittest
+from modules.data_handler import SearchIndex
+
+FIELDS = ('name', 'ingredients')
+
+def _random_text(rng):
+    """A few short words over a small alphabet, so queries often overlap them"""
+    return ' '.join(''.join(rng.choice('abcAB') for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(0, 3)))
+
+def _random_record(rng):
+    return {
+        'name': _random_text(rng),
+        'ingredients': _random_text(rng),
+        'language': rng.choice(('english', 'telugu'))
+    }
+
+def _naive_search(records, query, language=None):
+    """Positions of the records with a field containing query, checked one by one"""
+    query = query.casefold()
+    return [
+        position for position, record in enumerate(records)
+        if (not language or record.get('language') == language)
+        and any(query in str(record.get(field) or '').casefold() for field in FIELDS)
+    ]
+
+class SearchIndexTest(unittest.TestCase):
+    """SearchIndex returns the same records as scanning every record"""
+
+    def setUp(self):
+        self.rng = random.Random(1234)
+
+    def _assert_matches_naive(self, index, records):
+        for _ in range(200):
+            query = self.rng.choice(('', ' ', _random_text(self.rng)))
+            language = self.rng.choice((None, 'english', 'telugu'))
+            self.assertEqual(index.search(query, language), _naive_search(records, query, language), (query, language))
+
+    def test_build_and_search(self):
+        records = [_random_record(self.rng) for _ in range(60)]
+        index = SearchIndex(FIELDS)
+        index.build(records)
+        self._assert_matches_naive(index, records)
+
+    def test_add_and_update(self):
+        records = [_random_record(self.rng) for _ in range(30)]
+        index = SearchIndex(FIELDS)
+        index.build(records)
+
+        for _ in range(20):
+            record = _random_record(self.rng)
+            records.append(record)
+            index.add(record)
+
+            position = self.rng.randrange(len(records))
+            records[position] = _random_record(self.rng)
+            index.update(position, records[position])
+
+        self._assert_matches_naive(index, records)
+
+    def test_query_does_not_span_fields(self):
+        index = SearchIndex(FIELDS)
+        index.build([{'name': 'rice', 'ingredients': 'dal'}])
+        self.assertEqual(index.search('rice dal'), [])
+        self.assertEqual(index.search('RICE'), [0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import tempfile
+import unittest
+from unittest import mock
+from utils import disk_cache
+from utils.disk_cache import DiskCache
+
+class DiskCacheTest(unittest.TestCase):
+    """DiskCache stores values on disk and keeps only the newest entries"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(disk_cache, 'CACHE_DIR', self.directory.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+    def test_values_survive_a_new_instance(self):
+        cache = DiskCache('test')
+        cache.set('text', 'నమస్కారం')
+        cache.set_many([('audio', b'\x00\xff'), ('other', 'value')])
+
+        reopened = DiskCache('test')
+        self.assertEqual(reopened.get('text'), 'నమస్కారం')
+        self.assertEqual(reopened.get('audio'), b'\x00\xff')
+        self.assertIsNone(reopened.get('missing'))
+
+    def test_oldest_entries_are_trimmed(self):
+        cache = DiskCache('test', max_entries=10)
+        cache.set_many([(str(i), i) for i in range(100)])
+
+        kept = [i for i in range(100) if cache.get(str(i)) is not None]
+        self.assertEqual(kept, list(range(90, 100)))
+
+    def test_make_key(self):
+        self.assertEqual(DiskCache.make_key('te', False, 'text'), DiskCache.make_key('te', False, 'text'))
+        self.assertNotEqual(DiskCache.make_key('te', 'text'), DiskCache.make_key('en', 'text'))
+
+    def test_unusable_directory_misses_instead_of_failing(self):
+        with mock.patch.object(disk_cache, 'CACHE_DIR', '/dev/null/cache'):
+            cache = DiskCache('test')
+        cache.set('key', 'value')
+        self.assertIsNone(cache.get('key'))
+
+if __name__ == '__main__':
+    unittest.main()
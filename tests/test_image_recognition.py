@@ -0,0 +1,70 @@
+import io
+import time
+import unittest
+from PIL import Image
+from modules.image_recognition import ImageRecognitionService
+
+def _image_file(image):
+    """Encode an image as an in-memory PNG upload"""
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    buffer.seek(0)
+    return buffer
+
+class NearUniformImageTest(unittest.TestCase):
+    """Blank and single-color images are skipped before recognition"""
+
+    def setUp(self):
+        self.service = ImageRecognitionService()
+
+    def test_saturated_solid_color_is_uniform(self):
+        self.assertTrue(self.service._is_near_uniform(Image.new('RGB', (64, 64), (200, 20, 20))))
+
+    def test_gray_image_is_uniform(self):
+        self.assertTrue(self.service._is_near_uniform(Image.new('RGB', (64, 64), (128, 128, 128))))
+
+    def test_two_color_image_is_not_uniform(self):
+        image = Image.new('RGB', (64, 64), (200, 20, 20))
+        image.paste((20, 160, 20), (0, 0, 32, 64))
+        self.assertFalse(self.service._is_near_uniform(image))
+
+    def test_solid_color_upload_has_no_ingredients(self):
+        self.service.google_vision_api_key = None
+        self.service.azure_computer_vision_key = None
+        upload = _image_file(Image.new('RGB', (64, 64), (200, 20, 20)))
+        self.assertEqual(self.service.identify_ingredients(upload), [])
+
+class FastestProviderTest(unittest.TestCase):
+    """Racing both providers only settles on an empty result when neither finds anything"""
+
+    def setUp(self):
+        self.service = ImageRecognitionService()
+        self.image = Image.new('RGB', (8, 8))
+
+    def test_empty_first_result_waits_for_the_other_provider(self):
+        tomato = [{'name': 'tomato', 'confidence': 0.9, 'type': 'label'}]
+
+        def slow_azure(image):
+            time.sleep(0.05)
+            return tomato
+
+        self.service._identify_with_google_vision = lambda image: []
+        self.service._identify_with_azure = slow_azure
+        self.assertEqual(self.service._identify_with_fastest_provider(self.image), tomato)
+
+    def test_both_empty(self):
+        self.service._identify_with_google_vision = lambda image: []
+        self.service._identify_with_azure = lambda image: []
+        self.assertEqual(self.service._identify_with_fastest_provider(self.image), [])
+
+    def test_both_failing_raises(self):
+        def failing(image):
+            raise RuntimeError("provider down")
+
+        self.service._identify_with_google_vision = failing
+        self.service._identify_with_azure = failing
+        with self.assertRaises(RuntimeError):
+            self.service._identify_with_fastest_provider(self.image)
+
+if __name__ == '__main__':
+    unittest.main()
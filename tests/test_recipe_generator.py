@@ -0,0 +1,54 @@
+import random
+import unittest
+from modules.recipe_generator import IngredientMatcher, RecipeGenerator, RECIPE_TEMPLATES
+
+def _naive_records_containing(ingredient_lists, text):
+    """Records with an ingredient containing text, checked one by one"""
+    return {
+        record for record, ingredients in enumerate(ingredient_lists)
+        if any(text in ingredient.lower() for ingredient in ingredients)
+    }
+
+class IngredientMatcherTest(unittest.TestCase):
+    """IngredientMatcher finds the same records as checking every ingredient"""
+
+    def test_matches_naive_scan(self):
+        rng = random.Random(1234)
+        word = lambda: ''.join(rng.choice('abcdAB') for _ in range(rng.randint(1, 6)))
+        ingredient_lists = [[word() for _ in range(rng.randint(0, 5))] for _ in range(80)]
+        matcher = IngredientMatcher(ingredient_lists)
+
+        # Single characters use the joined-string scan, longer texts the bigram index
+        for _ in range(500):
+            text = word().lower()[:rng.randint(0, 4)]
+            self.assertEqual(matcher.records_containing(text), _naive_records_containing(ingredient_lists, text), text)
+
+    def test_text_spanning_two_ingredients_does_not_match(self):
+        matcher = IngredientMatcher([['rice', 'dal'], ['tomato']])
+        self.assertEqual(matcher.records_containing('ce'), {0})
+        self.assertEqual(matcher.records_containing('ced'), set())
+        self.assertEqual(matcher.records_containing('tom'), {1})
+
+class RecipeTemplateTest(unittest.TestCase):
+    """Generating from templates leaves the template data alone"""
+
+    def setUp(self):
+        self.generator = RecipeGenerator()
+
+    def test_templates_are_not_modified(self):
+        self.generator._generate_with_templates(['rice', 'vegetables', 'protein'])
+        for template in RECIPE_TEMPLATES:
+            self.assertFalse([key for key in template if key.startswith('_')], template['name'])
+
+    def test_template_added_at_runtime(self):
+        self.generator.recipe_templates = list(RECIPE_TEMPLATES) + [{
+            'name': 'Toast',
+            'required_ingredients': ['Bread'],
+            'optional_ingredients': ['Butter']
+        }]
+
+        recipes = self.generator._generate_with_templates(['bread', 'salted butter'])
+        self.assertEqual([recipe['ingredients'] for recipe in recipes if recipe['name'] == 'Toast'], ['bread, salted butter'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import tempfile
+import unittest
+from unittest import mock
+import streamlit as st
+from utils import disk_cache
+from modules.text_to_speech import TTSService
+
+class TeluguFallbackTest(unittest.TestCase):
+    """English audio substituted for Telugu is reported but never cached"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(disk_cache, 'CACHE_DIR', self.directory.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+        self.telugu_available = False
+
+    def _service(self):
+        service = TTSService()
+        service.use_google_api = False
+        service._gtts_audio = self._fake_gtts_audio
+        return service
+
+    def _fake_gtts_audio(self, text, gtts_lang, slow):
+        if gtts_lang == 'te' and not self.telugu_available:
+            raise ConnectionError("Telugu TTS unavailable")
+        return gtts_lang.encode()
+
+    def test_fallback_audio_is_not_cached(self):
+        with mock.patch.object(st, 'warning'):
+            self.assertEqual(self._service().synthesize('నమస్కారం', 'te'), b'en')
+
+        # Once Telugu works again, even a new service must not serve the English audio
+        self.telugu_available = True
+        self.assertEqual(self._service().synthesize('నమస్కారం', 'te'), b'te')
+
+    def test_fallback_warning_for_pooled_chunks(self):
+        service = self._service()
+        text = 'ఒక వాక్యం. ' * 1000
+        self.assertGreater(len(service.chunk_text(text)), 1)
+
+        with mock.patch.object(st, 'warning') as warning:
+            audio = service.synthesize_long(text, 'te')
+
+        self.assertEqual(audio, b'en' * len(service.chunk_text(text)))
+        warning.assert_called_once()
+
+    def test_no_warning_without_fallback(self):
+        self.telugu_available = True
+        with mock.patch.object(st, 'warning') as warning:
+            self.assertEqual(self._service().synthesize('నమస్కారం', 'te'), b'te')
+        warning.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
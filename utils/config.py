@@ -1,133 +1,349 @@
 import os
 import json
+import atexit
+import logging
+import weakref
+import functools
+import threading
+from datetime import datetime
+from contextlib import contextmanager
+from collections.abc import Mapping
+from types import MappingProxyType
 import streamlit as st
 
+# Environment variable holding each service's API key
+API_KEY_ENV_VARS = MappingProxyType({
+    'google_translate': 'GOOGLE_TRANSLATE_API_KEY',
+    'google_vision': 'GOOGLE_VISION_API_KEY',
+    'google_cloud_tts': 'GOOGLE_CLOUD_TTS_API_KEY',
+    'azure_computer_vision': 'AZURE_COMPUTER_VISION_KEY',
+    'azure_endpoint': 'AZURE_COMPUTER_VISION_ENDPOINT',
+    'openai': 'OPENAI_API_KEY',
+    'spoonacular': 'SPOONACULAR_API_KEY'
+})
+
+# (api_settings flag, api key) pairs switched on by an available key
+API_ENABLED_FLAGS = (
+    ('google_translate_enabled', 'google_translate'),
+    ('google_vision_enabled', 'google_vision'),
+    ('azure_vision_enabled', 'azure_computer_vision'),
+    ('openai_enabled', 'openai'),
+    ('spoonacular_enabled', 'spoonacular')
+)
+
+# Data sources selectable in the admin panel, and each one's position
+DATA_SOURCES = ('temporary', 'production')
+DATA_SOURCE_INDEX = MappingProxyType({source: index for index, source in enumerate(DATA_SOURCES)})
+
+# Top-level sections an imported configuration must contain
+REQUIRED_CONFIG_SECTIONS = frozenset({'data_source', 'api_settings', 'app_settings'})
+
+# Largest file accepted by import_config, far above any real configuration
+MAX_IMPORT_SIZE_BYTES = 1024 * 1024
+
+# Seconds to wait after a change before writing config.json, so bursts of changes are written once
+SAVE_DELAY_SECONDS = 0.5
+
+# Default configuration, also written to config.json when it does not exist yet
+DEFAULT_CONFIG = {
+    'data_source': 'temporary',
+    'api_settings': {
+        'google_translate_enabled': True,
+        'google_vision_enabled': True,
+        'azure_vision_enabled': False,
+        'openai_enabled': False,
+        'spoonacular_enabled': False
+    },
+    'app_settings': {
+        'default_language': 'english',
+        'max_file_size_mb': 10,
+        'supported_image_formats': ['jpg', 'jpeg', 'png'],
+        'max_text_length': 5000,
+        'cache_duration': 3600
+    },
+    'accessibility_settings': {
+        'high_contrast_mode': False,
+        'large_text_mode': False,
+        'screen_reader_mode': False,
+        'keyboard_navigation': True
+    },
+    'ui_settings': {
+        'theme': 'light',
+        'sidebar_expanded': True,
+        'show_accessibility_controls': True,
+        'show_statistics': False
+    }
+}
+
+# Serialized once so fresh deep copies of the defaults are a single parse
+DEFAULT_CONFIG_JSON = json.dumps(DEFAULT_CONFIG)
+
+# Shared read-only view of the defaults
+DEFAULT_CONFIG = MappingProxyType({
+    key: (MappingProxyType(value) if isinstance(value, dict) else value)
+    for key, value in DEFAULT_CONFIG.items()
+})
+
+logger = logging.getLogger(__name__)
+
+# Config instances with changes not yet written to disk
+_PENDING_CONFIGS = weakref.WeakSet()
+
+@atexit.register
+def _flush_pending_configs():
+    """Write every config with changes still pending when the process exits"""
+    for config in list(_PENDING_CONFIGS):
+        error = config._flush()
+        if error is not None:
+            logger.warning("Failed to save configuration: %s", error)
+
+@functools.lru_cache(maxsize=1)
+def _resolve_api_keys():
+    """Read the API keys from the environment once per process"""
+    environ = os.environ
+    return MappingProxyType({name: environ.get(env_var) for name, env_var in API_KEY_ENV_VARS.items()})
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key):
+    """Split a dotted config key into its path"""
+    return tuple(key.split('.'))
+
+@functools.lru_cache(maxsize=8)
+def _read_config_file(path, mtime_ns):
+    """Read a config file's text, reused until its modification time changes"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
 class Config:
     """Configuration management for the Sahachari application"""
     
+    __slots__ = (
+        'config_file', 'default_config', 'api_keys', '_service_display', '_config',
+        '_get_cache', '_enabled_services', '_save_lock', '_save_timer', '_dirty',
+        '_batch_depth', '_save_error', '__weakref__'
+    )
+    
     def __init__(self):
         self.config_file = 'config.json'
-        self.default_config = {
-            'data_source': 'temporary',
-            'api_settings': {
-                'google_translate_enabled': True,
-                'google_vision_enabled': True,
-                'azure_vision_enabled': False,
-                'openai_enabled': False,
-                'spoonacular_enabled': False
-            },
-            'app_settings': {
-                'default_language': 'english',
-                'max_file_size_mb': 10,
-                'supported_image_formats': ['jpg', 'jpeg', 'png'],
-                'max_text_length': 5000,
-                'cache_duration': 3600
-            },
-            'accessibility_settings': {
-                'high_contrast_mode': False,
-                'large_text_mode': False,
-                'screen_reader_mode': False,
-                'keyboard_navigation': True
-            },
-            'ui_settings': {
-                'theme': 'light',
-                'sidebar_expanded': True,
-                'show_accessibility_controls': True,
-                'show_statistics': False
-            }
-        }
+        self.default_config = DEFAULT_CONFIG
+        
+        # Configuration is loaded from disk on first access
+        self._config = None
         
-        # Load configuration
-        self.config = self._load_config()
+        # Values already resolved by get, cleared whenever the config changes
+        self._get_cache = {}
+        self._enabled_services = None
+        
+        # Pending write state for changes saved in the background
+        self._save_lock = threading.Lock()
+        self._save_timer = None
+        self._dirty = False
+        self._batch_depth = 0
+        self._save_error = None
         
         # Set up API keys from environment
-        self._setup_api_keys()
+        self.api_keys = _resolve_api_keys()
+        
+        # (label, has key) rows shown in the admin panel
+        self._service_display = tuple(
+            (setting[:-len('_enabled')].title(), bool(self.api_keys[api_name]))
+            for setting, api_name in API_ENABLED_FLAGS
+        )
+    
+    @property
+    def config(self):
+        """Get the configuration, loading it on first access"""
+        if self._config is None:
+            self._config = self._load_config()
+            self._setup_api_settings()
+        return self._config
+    
+    @config.setter
+    def config(self, value):
+        """Replace the configuration"""
+        self._config = value
+        self._invalidate_cache()
+    
+    def _invalidate_cache(self):
+        """Forget values derived from the configuration"""
+        self._get_cache.clear()
+        self._enabled_services = None
     
     def _load_config(self):
         """Load configuration from file or create default"""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                
-                # Merge with default config to ensure all keys exist
-                return self._merge_configs(self.default_config, config)
-            else:
+            try:
+                mtime_ns = os.stat(self.config_file).st_mtime_ns
+            except FileNotFoundError:
                 # Create default config file
-                self._save_config(self.default_config)
-                return self.default_config.copy()
+                config = self._copy_defaults()
+                self._save_config(config)
+                return config
+            
+            # Parse the cached text every time so each instance gets its own dicts
+            config = json.loads(_read_config_file(self.config_file, mtime_ns))
+            
+            # Merge with default config to ensure all keys exist
+            return self._merge_configs(self._copy_defaults(), config)
                 
         except Exception as e:
             st.warning(f"Failed to load configuration: {str(e)}. Using defaults.")
-            return self.default_config.copy()
+            return self._copy_defaults()
+    
+    def _copy_defaults(self):
+        """Get a deep copy of the default configuration"""
+        return json.loads(DEFAULT_CONFIG_JSON)
     
     def _merge_configs(self, default, loaded):
         """Merge loaded config with default config"""
-        merged = default.copy()
+        # Defaults are at most two levels deep, so copying each section once is enough
+        merged = {key: (dict(value) if isinstance(value, Mapping) else value) for key, value in default.items()}
         
         for key, value in loaded.items():
-            if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = self._merge_configs(merged[key], value)
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key].update(value)
             else:
                 merged[key] = value
         
         return merged
     
-    def _setup_api_keys(self):
-        """Setup API keys from environment variables"""
-        self.api_keys = {
-            'google_translate': os.getenv('GOOGLE_TRANSLATE_API_KEY'),
-            'google_vision': os.getenv('GOOGLE_VISION_API_KEY'),
-            'google_cloud_tts': os.getenv('GOOGLE_CLOUD_TTS_API_KEY'),
-            'azure_computer_vision': os.getenv('AZURE_COMPUTER_VISION_KEY'),
-            'azure_endpoint': os.getenv('AZURE_COMPUTER_VISION_ENDPOINT'),
-            'openai': os.getenv('OPENAI_API_KEY'),
-            'spoonacular': os.getenv('SPOONACULAR_API_KEY')
-        }
-        
-        # Update API settings based on available keys
-        self.config['api_settings']['google_translate_enabled'] = bool(self.api_keys['google_translate'])
-        self.config['api_settings']['google_vision_enabled'] = bool(self.api_keys['google_vision'])
-        self.config['api_settings']['azure_vision_enabled'] = bool(self.api_keys['azure_computer_vision'])
-        self.config['api_settings']['openai_enabled'] = bool(self.api_keys['openai'])
-        self.config['api_settings']['spoonacular_enabled'] = bool(self.api_keys['spoonacular'])
+    def _setup_api_settings(self):
+        """Enable the API settings whose keys are available"""
+        api_settings = self._config['api_settings']
+        for setting, api_name in API_ENABLED_FLAGS:
+            api_settings[setting] = bool(self.api_keys[api_name])
     
     def _save_config(self, config):
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            self._write_config(config)
         except Exception as e:
             st.error(f"Failed to save configuration: {str(e)}")
     
+    def _write_config(self, config):
+        """Write configuration to file atomically, skipping the write when the file already holds it"""
+        self._invalidate_cache()
+        
+        serialized = json.dumps(config, indent=2, ensure_ascii=False)
+        
+        # Compare with what is on disk now, which other instances or processes may have changed
+        try:
+            mtime_ns = os.stat(self.config_file).st_mtime_ns
+            if _read_config_file(self.config_file, mtime_ns) == serialized:
+                return
+        except FileNotFoundError:
+            pass
+        
+        # Write to a temporary file first so readers never see a partial file
+        temp_file = f"{self.config_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(serialized)
+        os.replace(temp_file, self.config_file)
+    
+    def _schedule_save(self):
+        """Mark the configuration as changed and write it shortly afterwards"""
+        self._invalidate_cache()
+        
+        # Report a failed background write here, where there is a script context to show it in
+        error, self._save_error = self._save_error, None
+        if error is not None:
+            st.error(f"Failed to save configuration: {str(error)}")
+        
+        with self._save_lock:
+            self._dirty = True
+            _PENDING_CONFIGS.add(self)
+            
+            # Changes made while any batch_updates block is open are written when the last one ends
+            if self._batch_depth:
+                return
+            
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DELAY_SECONDS, self._flush_in_background)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    @contextmanager
+    def batch_updates(self):
+        """Collect the changes made inside the block into a single write when it exits"""
+        # The instance is shared by every session thread, so batches are counted under the lock
+        with self._save_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._save_lock:
+                self._batch_depth -= 1
+                last_batch = self._batch_depth == 0
+            
+            if last_batch:
+                error = self._flush()
+                if error is not None:
+                    st.error(f"Failed to save configuration: {str(error)}")
+    
+    def _flush(self):
+        """
+        Write pending configuration changes to file
+        
+        Returns:
+            Exception: The error that stopped the write, or None
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            
+            if not self._dirty:
+                return None
+            
+            try:
+                self._write_config(self._config)
+            except Exception as e:
+                # Changes stay pending so a later flush retries them
+                return e
+            
+            self._dirty = False
+            _PENDING_CONFIGS.discard(self)
+            return None
+    
+    def _flush_in_background(self):
+        """Flush from the save timer, which has no Streamlit script context to report errors in"""
+        error = self._flush()
+        if error is not None:
+            logger.warning("Failed to save configuration: %s", error)
+            self._save_error = error
+    
     def get(self, key, default=None):
         """Get configuration value"""
-        keys = key.split('.')
+        try:
+            return self._get_cache[key]
+        except KeyError:
+            pass
+        
         value = self.config
         
         try:
-            for k in keys:
+            for k in _split_key(key):
                 value = value[k]
-            return value
         except (KeyError, TypeError):
             return default
+        
+        self._get_cache[key] = value
+        return value
     
     def set(self, key, value):
         """Set configuration value"""
-        keys = key.split('.')
+        keys = _split_key(key)
         config = self.config
         
         # Navigate to the parent of the target key
         for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+            config = config.setdefault(k, {})
         
         # Set the value
         config[keys[-1]] = value
         
         # Save to file
-        self._save_config(self.config)
+        self._schedule_save()
     
     @property
     def data_source(self):
@@ -138,7 +354,7 @@ class Config:
     def data_source(self, value):
         """Set data source"""
         self.config['data_source'] = value
-        self._save_config(self.config)
+        self._schedule_save()
     
     @property
     def default_language(self):
@@ -157,7 +373,13 @@ class Config:
     
     def is_api_enabled(self, api_name):
         """Check if a specific API is enabled"""
-        return self.config['api_settings'].get(f'{api_name}_enabled', False)
+        if self._enabled_services is None:
+            self._enabled_services = frozenset(
+                setting[:-len('_enabled')]
+                for setting, enabled in self.config['api_settings'].items()
+                if enabled and setting.endswith('_enabled')
+            )
+        return api_name in self._enabled_services
     
     def get_api_key(self, api_name):
         """Get API key for a specific service"""
@@ -166,7 +388,7 @@ class Config:
     def update_accessibility_settings(self, settings):
         """Update accessibility settings"""
         self.config['accessibility_settings'].update(settings)
-        self._save_config(self.config)
+        self._schedule_save()
     
     def get_accessibility_settings(self):
         """Get accessibility settings"""
@@ -174,14 +396,14 @@ class Config:
     
     def reset_to_defaults(self):
         """Reset configuration to defaults"""
-        self.config = self.default_config.copy()
+        self.config = self._copy_defaults()
         self._save_config(self.config)
         st.success("Configuration reset to defaults")
     
     def export_config(self, filename=None):
         """Export configuration to file"""
         if not filename:
-            filename = f"sahachari_config_export_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.json"
+            filename = f"sahachari_config_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
             with open(filename, 'w', encoding='utf-8') as f:
@@ -194,12 +416,23 @@ class Config:
     def import_config(self, config_file):
         """Import configuration from file"""
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                imported_config = json.load(f)
+            # Accept uploaded files as well as paths, reading at most one byte past the limit
+            if hasattr(config_file, 'read'):
+                raw_config = config_file.read(MAX_IMPORT_SIZE_BYTES + 1)
+            else:
+                with open(config_file, 'rb') as f:
+                    raw_config = f.read(MAX_IMPORT_SIZE_BYTES + 1)
+            
+            # Reject oversized files before parsing anything
+            if len(raw_config) > MAX_IMPORT_SIZE_BYTES:
+                st.error("Invalid configuration file")
+                return False
+            
+            imported_config = json.loads(raw_config)
             
             # Validate imported config
             if self._validate_config(imported_config):
-                self.config = self._merge_configs(self.default_config, imported_config)
+                self.config = self._merge_configs(self._copy_defaults(), imported_config)
                 self._save_config(self.config)
                 st.success("Configuration imported successfully")
                 return True
@@ -213,15 +446,7 @@ class Config:
     
     def _validate_config(self, config):
         """Validate configuration structure"""
-        required_sections = ['data_source', 'api_settings', 'app_settings']
-        
-        try:
-            for section in required_sections:
-                if section not in config:
-                    return False
-            return True
-        except:
-            return False
+        return isinstance(config, dict) and REQUIRED_CONFIG_SECTIONS.issubset(config)
     
     def get_environment_info(self):
         """Get environment information for debugging"""
@@ -236,62 +461,59 @@ class Config:
     
     def render_admin_panel(self):
         """Render admin configuration panel"""
-        st.subheader("⚙️ Configuration")
-        
-        # Data source selection
-        data_sources = ['temporary', 'production']
-        current_source = st.selectbox(
-            "Data Source",
-            data_sources,
-            index=data_sources.index(self.data_source)
-        )
-        
-        if current_source != self.data_source:
-            self.data_source = current_source
-            st.rerun()
-        
-        # API settings
-        st.markdown("### API Settings")
-        for api_name, enabled in self.config['api_settings'].items():
-            if api_name.endswith('_enabled'):
-                service_name = api_name.replace('_enabled', '')
-                has_key = bool(self.get_api_key(service_name))
-                
+        # Settings changed in the panel are saved together once it has rendered
+        with self.batch_updates():
+            st.subheader("⚙️ Configuration")
+            
+            # Data source selection
+            current_source = st.selectbox(
+                "Data Source",
+                DATA_SOURCES,
+                index=DATA_SOURCE_INDEX[self.data_source]
+            )
+            
+            if current_source != self.data_source:
+                self.data_source = current_source
+                st.rerun()
+            
+            # API settings
+            st.markdown("### API Settings")
+            for service_label, has_key in self._service_display:
                 col1, col2 = st.columns([3, 1])
                 with col1:
-                    st.write(f"**{service_name.title()}**: {'✅' if has_key else '❌'}")
+                    st.write(f"**{service_label}**: {'✅' if has_key else '❌'}")
                 with col2:
                     st.write("Available" if has_key else "No API Key")
-        
-        # App settings
-        st.markdown("### App Settings")
-        max_file_size = st.number_input(
-            "Max File Size (MB)",
-            min_value=1,
-            max_value=100,
-            value=self.max_file_size_mb
-        )
-        
-        if max_file_size != self.max_file_size_mb:
-            self.set('app_settings.max_file_size_mb', max_file_size)
-        
-        # Export/Import
-        st.markdown("### Configuration Management")
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            if st.button("Export Config"):
-                filename = self.export_config()
-                if filename:
-                    st.success(f"Exported to {filename}")
-        
-        with col2:
-            uploaded_config = st.file_uploader("Import Config", type=['json'])
-            if uploaded_config:
-                if self.import_config(uploaded_config):
+            
+            # App settings
+            st.markdown("### App Settings")
+            max_file_size = st.number_input(
+                "Max File Size (MB)",
+                min_value=1,
+                max_value=100,
+                value=self.max_file_size_mb
+            )
+            
+            if max_file_size != self.max_file_size_mb:
+                self.set('app_settings.max_file_size_mb', max_file_size)
+            
+            # Export/Import
+            st.markdown("### Configuration Management")
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                if st.button("Export Config"):
+                    filename = self.export_config()
+                    if filename:
+                        st.success(f"Exported to {filename}")
+            
+            with col2:
+                uploaded_config = st.file_uploader("Import Config", type=['json'])
+                if uploaded_config:
+                    if self.import_config(uploaded_config):
+                        st.rerun()
+            
+            with col3:
+                if st.button("Reset to Defaults"):
+                    self.reset_to_defaults()
                     st.rerun()
-        
-        with col3:
-            if st.button("Reset to Defaults"):
-                self.reset_to_defaults()
-                st.rerun()
@@ -3,6 +3,8 @@ Constants file for Sahachari application
 Contains language mappings, menu items, and other configuration constants
 """
 
+from types import MappingProxyType
+
 # Language Configuration
 LANGUAGES = {
     'english': {
@@ -73,6 +75,10 @@ RECIPE_TEXT = {
         'english': 'Select a recipe:',
         'telugu': 'వంటకం ఎంచుకోండి:'
     },
+    'filter_recipes': {
+        'english': 'Filter recipes by name:',
+        'telugu': 'పేరుతో వంటకాలను వడపోయండి:'
+    },
     'original': {
         'english': 'Original',
         'telugu': 'మూలం'
@@ -204,6 +210,14 @@ GENERATION_TEXT = {
     'recipe_type_failed': {
         'english': 'Could not generate a recipe of this type.',
         'telugu': 'ఈ రకమైన వంటకం రూపొందించబడలేదు.'
+    },
+    'recipe_title': {
+        'english': 'Recipe {index}: {name}',
+        'telugu': 'వంటకం {index}: {name}'
+    },
+    'unnamed': {
+        'english': 'Unnamed',
+        'telugu': 'పేరులేని'
     }
 }
 
@@ -280,6 +294,18 @@ NEWSPAPER_TEXT = {
     'translation_result': {
         'english': 'Translation',
         'telugu': 'అనువాదం'
+    },
+    'previous_page': {
+        'english': '← Previous',
+        'telugu': '← మునుపటి'
+    },
+    'next_page': {
+        'english': 'Next →',
+        'telugu': 'తదుపరి →'
+    },
+    'page_info': {
+        'english': 'Page {page} of {total}',
+        'telugu': 'పేజీ {page} / {total}'
     }
 }
 
@@ -396,7 +422,9 @@ UI_CONFIG = {
     'sidebar_width': 300,
     'main_content_width': 800,
     'image_display_width': 400,
-    'audio_player_width': 300
+    'audio_player_width': 300,
+    'articles_per_page': 20,
+    'max_recipe_options': 100
 }
 
 # Data Validation Rules
@@ -521,3 +549,62 @@ NUTRITION_CATEGORIES = {
     }
 }
 
+
+def _freeze(value):
+    """Turn nested dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# The tables above are never modified, so share them as read-only mappings
+LANGUAGES = _freeze(LANGUAGES)
+MENU_ITEMS = _freeze(MENU_ITEMS)
+APP_TEXT = _freeze(APP_TEXT)
+RECIPE_TEXT = _freeze(RECIPE_TEXT)
+INGREDIENT_TEXT = _freeze(INGREDIENT_TEXT)
+GENERATION_TEXT = _freeze(GENERATION_TEXT)
+RECIPE_TYPES = _freeze(RECIPE_TYPES)
+NEWSPAPER_TEXT = _freeze(NEWSPAPER_TEXT)
+ACCESSIBILITY_TEXT = _freeze(ACCESSIBILITY_TEXT)
+ERROR_MESSAGES = _freeze(ERROR_MESSAGES)
+SUCCESS_MESSAGES = _freeze(SUCCESS_MESSAGES)
+FILE_UPLOAD = _freeze(FILE_UPLOAD)
+API_CONFIG = _freeze(API_CONFIG)
+UI_CONFIG = _freeze(UI_CONFIG)
+VALIDATION_RULES = _freeze(VALIDATION_RULES)
+DEFAULTS = _freeze(DEFAULTS)
+NAVIGATION = _freeze(NAVIGATION)
+FOOD_CATEGORIES = _freeze(FOOD_CATEGORIES)
+COOKING_METHODS = _freeze(COOKING_METHODS)
+NUTRITION_CATEGORIES = _freeze(NUTRITION_CATEGORIES)
+
+# Localized text tables by section name, as used with t()
+TEXT_SECTIONS = MappingProxyType({
+    'menu': MENU_ITEMS,
+    'app': APP_TEXT,
+    'recipe': RECIPE_TEXT,
+    'ingredient': INGREDIENT_TEXT,
+    'generation': GENERATION_TEXT,
+    'recipe_type': RECIPE_TYPES,
+    'newspaper': NEWSPAPER_TEXT,
+    'accessibility': ACCESSIBILITY_TEXT,
+    'error': ERROR_MESSAGES,
+    'success': SUCCESS_MESSAGES,
+    'food_category': FOOD_CATEGORIES,
+    'cooking_method': COOKING_METHODS,
+    'nutrition': NUTRITION_CATEGORIES
+})
+
+# Every localized string keyed by (section, key, language)
+_FLAT_TEXT = {
+    (section, key, language): text
+    for section, table in TEXT_SECTIONS.items()
+    for key, translations in table.items()
+    for language, text in translations.items()
+}
+
+def t(section, key, language):
+    """Get the localized text for a key of a TEXT_SECTIONS section in one lookup"""
+    return _FLAT_TEXT[(section, key, language)]
@@ -0,0 +1,84 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+
+# Directory holding the on-disk caches
+CACHE_DIR = '.cache'
+
+class DiskCache:
+    """Small SQLite-backed key/value cache that survives process restarts"""
+
+    def __init__(self, name, max_entries=10000):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.writes = 0
+
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            self.connection = sqlite3.connect(os.path.join(CACHE_DIR, f"{name}.sqlite3"), check_same_thread=False)
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, stored REAL)'
+            )
+            self.connection.commit()
+        except (OSError, sqlite3.Error):
+            # Without a usable cache file every lookup is simply a miss
+            self.connection = None
+
+    @staticmethod
+    def make_key(*parts):
+        """Build a fixed-size key from the parts that determine a cached result"""
+        return hashlib.blake2b('\x1f'.join(str(part) for part in parts).encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key):
+        """
+        Look up a cached value
+
+        Args:
+            key (str): Key from make_key
+
+        Returns:
+            The stored value, or None when missing or unreadable
+        """
+        if self.connection is None:
+            return None
+
+        try:
+            with self.lock:
+                row = self.connection.execute('SELECT value FROM cache WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def set(self, key, value):
+        """Store a single value"""
+        self.set_many([(key, value)])
+
+    def set_many(self, items):
+        """Store several (key, value) pairs in one transaction, dropping the oldest entries once over the size limit"""
+        if self.connection is None or not items:
+            return
+
+        stored = time.time()
+        try:
+            with self.lock:
+                self.connection.executemany(
+                    'INSERT OR REPLACE INTO cache (key, value, stored) VALUES (?, ?, ?)',
+                    [(key, value, stored) for key, value in items]
+                )
+
+                # Trim only every so often, finding the oldest rows scans the table
+                previous_writes = self.writes
+                self.writes += len(items)
+                if self.writes // 100 != previous_writes // 100:
+                    self.connection.execute(
+                        'DELETE FROM cache WHERE key IN '
+                        '(SELECT key FROM cache ORDER BY stored DESC, rowid DESC LIMIT -1 OFFSET ?)',
+                        (self.max_entries,)
+                    )
+
+                self.connection.commit()
+        except sqlite3.Error:
+            # A failed write only costs a future cache miss
+            pass
@@ -0,0 +1,31 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeout in seconds for calls to external APIs
+REQUEST_TIMEOUT = (3, 10)
+
+def create_session(pool_connections=10, pool_maxsize=20):
+    """
+    Create a requests session that keeps connections alive between API calls
+
+    Args:
+        pool_connections (int): Number of hosts to keep connection pools for
+        pool_maxsize (int): Maximum connections kept per host
+
+    Returns:
+        requests.Session: Session retrying idempotent requests on transient errors
+    """
+    retries = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        # Hand the last response back so callers keep reporting the status code
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retries)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session